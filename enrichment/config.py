@@ -47,6 +47,9 @@ def get_profile_dir(run_id: str) -> Path:
 
 # Rate limiting
 REQUEST_DELAY = 1.5  # seconds between requests within same org
+MAX_CONCURRENT_FETCHES = 16  # in-flight detail/API/PDF requests per process
+MAX_FETCHES_PER_HOST = 4  # in-flight job detail fetches against one host
+MAX_PLAYWRIGHT_WORKERS = 4  # job workers per org when details need a browser
 
 # Timeouts
 REQUEST_TIMEOUT = 30  # seconds for HTTP requests
@@ -54,6 +57,10 @@ PLAYWRIGHT_TIMEOUT = 45000  # milliseconds
 
 # Content limits
 MAX_DESCRIPTION_CHARS = 50_000
+MAX_HTML_BYTES = 5 * 1024 * 1024  # stop reading detail pages past this size
+
+# Scraper listing cache (skipped when force=True)
+LISTING_CACHE_MAX_AGE = 6 * 3600  # seconds
 
 # Re-export for convenience
 __all__ = [
@@ -65,9 +72,14 @@ __all__ = [
     "get_pdf_dir",
     "get_profile_dir",
     "REQUEST_DELAY",
+    "MAX_CONCURRENT_FETCHES",
+    "MAX_FETCHES_PER_HOST",
+    "MAX_PLAYWRIGHT_WORKERS",
     "REQUEST_TIMEOUT",
     "PLAYWRIGHT_TIMEOUT",
     "MAX_DESCRIPTION_CHARS",
+    "MAX_HTML_BYTES",
+    "LISTING_CACHE_MAX_AGE",
     "PLAYWRIGHT_ORGS",
     "PLAYWRIGHT_DOMAINS",
     "NEXTJS_PLATFORMS",
@@ -0,0 +1,66 @@
+"""Process-wide cache of fetched job details, shared across orgs."""
+
+import threading
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .config import MAX_DESCRIPTION_CHARS
+
+
+def normalize_url(url: str) -> str:
+    """Canonical cache key for a detail URL.
+
+    Scheme and host are lowercased and query parameters sorted. The fragment
+    is kept: table-interface URLs address individual rows by `#row-N`.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, parts.fragment)
+    )
+
+
+class DetailCache:
+    """Thread-safe LRU of successful fetch results keyed by normalized URL.
+
+    Bounded by entry count and by the total length of the cached descriptions,
+    whichever is reached first.
+    """
+
+    def __init__(self, maxsize: int = 2_000, max_chars: int = 8_000_000):
+        self.maxsize = maxsize
+        self.max_chars = max_chars
+        self._lock = threading.Lock()
+        self._items: OrderedDict[str, dict] = OrderedDict()
+        self._chars = 0
+
+    def get(self, url: str) -> dict | None:
+        key = normalize_url(url)
+        with self._lock:
+            result = self._items.get(key)
+            if result is None:
+                return None
+            self._items.move_to_end(key)
+            return dict(result)
+
+    def put(self, url: str, result: dict) -> bool:
+        """Store a fetch result if it is a usable success; return whether stored."""
+        if result.get("error") or result.get("enrich_status") not in ("ok", "pdf"):
+            return False
+        size = len(result.get("description", ""))
+        if size > MAX_DESCRIPTION_CHARS or size > self.max_chars:
+            return False
+        key = normalize_url(url)
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._chars -= len(old.get("description", ""))
+            self._items[key] = dict(result)
+            self._chars += size
+            while len(self._items) > self.maxsize or self._chars > self.max_chars:
+                _, evicted = self._items.popitem(last=False)
+                self._chars -= len(evicted.get("description", ""))
+        return True
+
+    def __len__(self) -> int:
+        return len(self._items)
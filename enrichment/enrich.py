@@ -1,5 +1,7 @@
 """Orchestrator: run scrapers and enrich their output with job descriptions."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from .runner import (
@@ -8,6 +10,7 @@ from .runner import (
     default_ndjson_path,
     default_run_id,
     enrich_org_via_runner,
+    preload_scraper_module,
 )
 from .schema import extract_abbrev
 
@@ -25,6 +28,7 @@ def enrich_org(
     profile: bool = False,
     max_jobs: int | None = None,
     job_timeout_seconds: float = 30.0,
+    job_workers: int = 1,
 ) -> dict:
     """Scrape and enrich all jobs for a single organization."""
     print(f"\n{'=' * 60}")
@@ -53,6 +57,7 @@ def enrich_org(
             profile=profile,
             max_jobs=max_jobs,
             job_timeout_seconds=job_timeout_seconds,
+            job_workers=job_workers,
         )
         print(f"\n  Run log: {ndjson_path}")
         return result
@@ -70,8 +75,17 @@ def enrich_all(
     max_orgs: int | None = None,
     max_jobs: int | None = None,
     job_timeout_seconds: float = 30.0,
+    parallel_orgs: int = 1,
+    job_workers: int = 1,
 ) -> list[dict]:
-    """Enrich all organizations from a scraper registry."""
+    """Enrich all organizations from a scraper registry.
+
+    With parallel_orgs > 1, orgs are enriched concurrently in a thread pool;
+    results keep registry order either way, and a progress line is printed as
+    each org completes. Each result is also emitted as an ``org_result`` event
+    as soon as its org finishes. job_workers > 1 additionally fetches each
+    org's job details concurrently.
+    """
     run_id = default_run_id("all")
     ndjson_path = log_ndjson or default_ndjson_path(run_id)
     cfg = RunnerConfig(
@@ -82,50 +96,101 @@ def enrich_all(
         profile=profile,
     )
     logger = EventLogger(cfg)
-    results = []
 
+    totals = {"succeeded": 0, "failed": 0, "jobs": 0}
+    totals_lock = threading.Lock()
+
+    def _record(result: dict, events: list[dict] | None = None) -> dict:
+        logger.emit_many([*(events or []), {"event": "org_result", **result}])
+        with totals_lock:
+            if "error" in result:
+                totals["failed"] += 1
+            else:
+                totals["succeeded"] += 1
+                totals["jobs"] += result.get("job_count", 0)
+        return result
+
+    def _run_one(idx: int) -> dict:
+        scraper_file, org_name, org_abbrev, is_pw_scraper = orgs[idx]
+
+        # Import a later org's scraper while this org is busy with HTTP. Orgs
+        # start in registry order, so with N workers the orgs up to idx + N - 1
+        # are already running; idx + N is the first one nobody has started.
+        ahead = idx + max(1, parallel_orgs)
+        if ahead < len(orgs):
+            next_file, _, _, next_is_pw = orgs[ahead]
+            prefetch.submit(preload_scraper_module, next_file, next_is_pw)
+
+        try:
+            result = enrich_org_via_runner(
+                org_abbrev=org_abbrev,
+                org_name=org_name,
+                scraper_file=scraper_file,
+                is_playwright_scraper=is_pw_scraper,
+                use_playwright_detail=use_playwright_detail,
+                force=force,
+                logger=logger,
+                profile=profile,
+                max_jobs=max_jobs,
+                job_timeout_seconds=job_timeout_seconds,
+                job_workers=job_workers,
+            )
+        except Exception as e:  # noqa: BLE001
+            print(f"\n  FAILED to enrich {org_name}: {e}")
+            done = {
+                "event": "org_done",
+                "org_abbrev": org_abbrev,
+                "org_name": org_name,
+                "scraper_error": str(e),
+                "job_count": 0,
+            }
+            result = {
+                "org_name": org_name,
+                "org_abbrev": org_abbrev,
+                "error": str(e),
+            }
+            return _record(result, [done])
+        return _record(result)
+
+    items = list(registry.items())
+    if max_orgs and max_orgs > 0:
+        items = items[:max_orgs]
+    # Resolve each entry once up front: (scraper_file, org_name, abbrev, is_pw).
+    orgs = [
+        (
+            scraper_file,
+            info[0],
+            extract_abbrev(info[0]),
+            bool(info[2]) if len(info) > 2 else False,
+        )
+        for scraper_file, info in items
+    ]
+    prefetch = ThreadPoolExecutor(max_workers=1)
+
+    results: list[dict]
     try:
-        items = list(registry.items())
-        if max_orgs and max_orgs > 0:
-            items = items[:max_orgs]
-
-        for scraper_file, info in items:
-            org_name = info[0]
-            is_pw_scraper = info[2] if len(info) > 2 else False
-            org_abbrev = extract_abbrev(org_name)
-
-            try:
-                result = enrich_org_via_runner(
-                    org_abbrev=org_abbrev,
-                    org_name=org_name,
-                    scraper_file=scraper_file,
-                    is_playwright_scraper=is_pw_scraper,
-                    use_playwright_detail=use_playwright_detail,
-                    force=force,
-                    logger=logger,
-                    profile=profile,
-                    max_jobs=max_jobs,
-                    job_timeout_seconds=job_timeout_seconds,
-                )
-                results.append(result)
-            except Exception as e:  # noqa: BLE001
-                print(f"\n  FAILED to enrich {org_name}: {e}")
-                logger.emit(
-                    "org_done",
-                    org_abbrev=org_abbrev,
-                    org_name=org_name,
-                    scraper_error=str(e),
-                    job_count=0,
-                )
-                results.append(
-                    {
-                        "org_name": org_name,
-                        "org_abbrev": org_abbrev,
-                        "error": str(e),
-                    }
-                )
-
-        print(f"\nRun log: {ndjson_path}")
+        if parallel_orgs <= 1 or len(orgs) <= 1:
+            results = [_run_one(idx) for idx in range(len(orgs))]
+        else:
+            results = [{} for _ in orgs]
+            with ThreadPoolExecutor(max_workers=parallel_orgs) as pool:
+                futures = {pool.submit(_run_one, idx): idx for idx in range(len(orgs))}
+                for done, fut in enumerate(as_completed(futures), start=1):
+                    idx = futures[fut]
+                    result = results[idx] = fut.result()
+                    status = (
+                        f"FAILED: {result['error']}"
+                        if "error" in result
+                        else f"{result.get('job_count', 0)} jobs"
+                    )
+                    print(f"  [{done}/{len(orgs)}] {orgs[idx][2]} done ({status})")
+
+        print(
+            f"\nDone: {totals['succeeded']} succeeded, {totals['failed']} failed, "
+            f"{totals['jobs']} jobs"
+        )
+        print(f"Run log: {ndjson_path}")
         return results
     finally:
+        prefetch.shutdown(cancel_futures=True)
         logger.close()
@@ -1,17 +1,38 @@
 """Fetch job descriptions: PDF detection, download, and HTML text extraction."""
 
-import json
+import functools
+import hashlib
+import heapq
+import os
 import re
+import shutil
 import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date
+from html import unescape
 from pathlib import Path
+from typing import NamedTuple
 from urllib.parse import unquote, urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config import USER_AGENT
-from .config import MAX_DESCRIPTION_CHARS, REQUEST_TIMEOUT
+from scrapers_playwright.browser_pool import POOL as PLAYWRIGHT_POOL
+from . import jsonio
+from .config import (
+    MAX_CONCURRENT_FETCHES,
+    MAX_DESCRIPTION_CHARS,
+    MAX_HTML_BYTES,
+    REQUEST_TIMEOUT,
+)
 from .org_config import (
     SSL_INSECURE_DOMAINS,
     PREFER_EMBEDDED_PDF_ORGS,
@@ -24,8 +45,65 @@ from .org_config import (
 )
 
 # Add scrapers dir to path so we can import base.fetch
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scrapers"))
-from base import DEFAULT_HEADERS, fetch  # noqa: E402
+_SCRAPERS_DIR = str(Path(__file__).resolve().parent.parent / "scrapers")
+if _SCRAPERS_DIR not in sys.path:
+    sys.path.insert(0, _SCRAPERS_DIR)
+from base import DEFAULT_HEADERS, fetch, reset_session  # noqa: E402
+
+# Session for the direct GETs below (PDF downloads, JSON APIs); page fetches
+# go through base.fetch. Same per-thread policy as scrapers/base.py.
+_LOCAL = threading.local()
+
+
+def _session() -> requests.Session:
+    """Return this thread's session, creating it on first use."""
+    session = getattr(_LOCAL, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            max_retries=Retry(
+                total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _LOCAL.session = session
+    return session
+
+
+def reset_sessions():
+    """Close this thread's HTTP sessions, here and in base, dropping cookies."""
+    session = getattr(_LOCAL, "session", None)
+    _LOCAL.session = None
+    if session is not None:
+        session.close()
+    reset_session()
+
+
+# Process-wide cap on in-flight HTTP requests from this module. Orgs and
+# their job workers run concurrently, and without a shared cap their
+# product could burst far past what remote hosts tolerate.
+_FETCH_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_FETCHES)
+
+try:
+    import lxml.html as lxml_html
+
+    _HTML_PARSER = "lxml"
+except ImportError:  # optional accelerator
+    lxml_html = None
+    _HTML_PARSER = "html.parser"
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional accelerator
+    LexborHTMLParser = None
+
+try:
+    from bs4.filter import ElementFilter
+except ImportError:  # beautifulsoup4 < 4.13 cannot filter on attributes
+    ElementFilter = None
 
 # Markers indicating a page requires JavaScript to render meaningful content
 JS_PLACEHOLDER_MARKERS = (
@@ -65,9 +143,97 @@ PDF_NEGATIVE_MARKERS = (
     "gdpr",
 )
 
+# Every marker present in a candidate's blob adds its weight once; one flat
+# table keeps scoring to a single pass.
+_PDF_MARKER_WEIGHTS = (
+    (("download", 15),)
+    + tuple((marker, 45) for marker in PDF_POSITIVE_MARKERS)
+    + tuple((marker, -120) for marker in PDF_NEGATIVE_MARKERS)
+    + (("application form", -120),)
+)
+
+
+# Regexes used on every job, compiled once at import.
+_WORDS_RE = re.compile(r"[a-z0-9]{4,}")
+_SLUG_NONWORD_RE = re.compile(r"[^\w\s-]")
+_SLUG_SPACE_RE = re.compile(r"[\s_]+")
+_SLUG_DASH_RE = re.compile(r"-+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_ROW_FRAGMENT_RE = re.compile(r"row-(\d+)$")
+_VACANCY_ID_RE = re.compile(r"/vacancies/(\d+)")
+_VACANCY_UUID_RE = re.compile(r"/vacancy/([0-9a-f]{16,32})", re.IGNORECASE)
+_LEGACY_FRAGMENT_MARKER = "!|!!*!"
+_SINGLEVIEW_MARKUP_RE = re.compile(
+    r"""class\s*=\s*["'][^"']*\bsingleview\b""", re.IGNORECASE
+)
+_LEGACY_JOB_DELIM_RE = re.compile(r"!\|!\d{6,8}!\|!")
+_REQUISITION_DESC_RE = re.compile(r"requisitionDescription", re.IGNORECASE)
+_MSO_NORMAL_RE = re.compile(r"MsoNormal", re.IGNORECASE)
+_LOCALE_RE = re.compile(r"[a-z]{2}-[a-z]{2}", re.IGNORECASE)
+# Absolute or root-relative PDF URLs in one pass; an absolute match consumes
+# its own path so it is not also picked up as a relative one.
+_PDF_RAW_URL_RE = re.compile(
+    r'(?:https?:/)?/[^\s"\'<>]+?\.pdf(?:\?[^\s"\'<>]*)?', re.IGNORECASE
+)
+_PDF_SUFFIX_RE = re.compile(r"\.pdf(?:[?#]|$)", re.IGNORECASE)
+_ANCHOR_OPEN_RE = re.compile(r"<a\s", re.IGNORECASE)
+_ANCHOR_RE = re.compile(
+    r"""<a\b[^>]*?\bhref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))[^>]*>(.*?)</a\s*>""",
+    re.IGNORECASE | re.DOTALL,
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+# Whole lines of site chrome dropped by _clean_text.
+_NOISE_LINE_RE = re.compile(
+    r"view profile|employee login|create/ view profile|language|loading", re.IGNORECASE
+)
+_NEXT_DATA_RE = re.compile(
+    r"""<script\b[^>]*\bid\s*=\s*["']?__NEXT_DATA__["']?[^>]*>(.*?)</script\s*>""",
+    re.IGNORECASE | re.DOTALL,
+)
+_BLOCK_BOUNDARY_RE = re.compile(
+    r"<(?:/?(?:a|li|p|td|th|tr|div|ul|ol|table|section|article|h[1-6]|script|style)\b"
+    r"|br\b)[^>]*>",
+    re.IGNORECASE,
+)
 
-def _norm_words(text: str) -> set[str]:
-    stop = {
+
+# Next.js payload scoring: JSON paths that look like descriptions, and text
+# that looks like page chrome.
+_NEXTJS_KEY_MARKERS = (
+    "description",
+    "jobdescription",
+    "job_description",
+    "responsibil",
+    "profile",
+    "qualification",
+    "requirement",
+    "offer",
+    "about",
+)
+_NEXTJS_NOISE_MARKERS = (
+    "job list",
+    "please confirm this action",
+    "privacy policy",
+    "imprint",
+    "navigation",
+)
+
+
+def _marker_re(markers: tuple[str, ...], flags: int = 0) -> re.Pattern:
+    """Compile literal markers into one alternation for a single-pass any()."""
+    return re.compile("|".join(re.escape(m) for m in markers), flags)
+
+
+# Case-insensitive so callers can search page text without lowering a copy.
+_JS_PLACEHOLDER_RE = _marker_re(JS_PLACEHOLDER_MARKERS, re.IGNORECASE)
+_ENABLE_JS_RE = re.compile("enable javascript", re.IGNORECASE)
+_PDF_WORD_RE = re.compile("pdf", re.IGNORECASE)
+_NEXTJS_KEY_RE = _marker_re(_NEXTJS_KEY_MARKERS)
+_NEXTJS_NOISE_RE = _marker_re(_NEXTJS_NOISE_MARKERS)
+
+
+_STOP_WORDS = frozenset(
+    {
         "with",
         "from",
         "into",
@@ -80,80 +246,243 @@ def _norm_words(text: str) -> set[str]:
         "our",
         "about",
     }
-    words = re.findall(r"[a-z0-9]{4,}", (text or "").lower())
-    return {w for w in words if w not in stop}
+)
+
+
+@functools.lru_cache(maxsize=2048)
+def _norm_words(text: str) -> frozenset[str]:
+    return frozenset(_WORDS_RE.findall((text or "").lower())) - _STOP_WORDS
 
 
 def slugify(text: str, max_len: int = 80) -> str:
     """Convert text to a filesystem-safe slug."""
     text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_]+", "-", text)
-    text = re.sub(r"-+", "-", text).strip("-")
+    text = _SLUG_NONWORD_RE.sub("", text)
+    text = _SLUG_SPACE_RE.sub("-", text)
+    text = _SLUG_DASH_RE.sub("-", text).strip("-")
     return text[:max_len]
 
 
+@functools.lru_cache(maxsize=8192)
+def _parse_url(url: str):
+    """urlparse, memoized: one job's URL is parsed by several helpers."""
+    return urlparse(url)
+
+
+@functools.lru_cache(maxsize=8192)
 def _url_host(url: str) -> str:
-    return (urlparse(url).netloc or "").lower()
+    return (_parse_url(url).netloc or "").lower()
+
+
+# Domain lists are matched as substrings of the host, so one scan per host
+# (cached) tags it with every platform it belongs to.
+_PLATFORM_DOMAINS = (
+    ("table", TABLE_INTERFACE_DOMAINS),
+    ("platform_a", PLATFORM_A_DOMAINS),
+    ("api_v1", API_BASED_V1_DOMAINS),
+    ("api_v2", API_BASED_V2_DOMAINS),
+    ("nextjs", NEXTJS_PLATFORMS),
+    ("playwright", PLAYWRIGHT_DOMAINS),
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _host_platforms(host: str) -> frozenset[str]:
+    """Return the platform tags whose domain lists match host."""
+    return frozenset(
+        tag
+        for tag, domains in _PLATFORM_DOMAINS
+        if any(domain in host for domain in domains)
+    )
 
 
+@functools.lru_cache(maxsize=8192)
 def _verify_ssl(url: str) -> bool:
     return _url_host(url) not in SSL_INSECURE_DOMAINS
 
 
+@functools.lru_cache(maxsize=8192)
 def _is_table_row_url(url: str) -> bool:
     """Check if URL points to a table-based interface with row fragments."""
-    parsed = urlparse(url)
-    host = parsed.netloc.lower()
-    return any(domain in host for domain in TABLE_INTERFACE_DOMAINS) and bool(
-        re.search(r"row-(\d+)$", parsed.fragment or "")
+    parsed = _parse_url(url)
+    return "table" in _host_platforms(parsed.netloc.lower()) and bool(
+        _ROW_FRAGMENT_RE.search(parsed.fragment or "")
     )
 
 
 def _extract_table_row_index(url: str) -> int | None:
     """Extract row index from a table-based interface URL fragment."""
-    parsed = urlparse(url)
-    m = re.search(r"row-(\d+)$", parsed.fragment or "")
+    parsed = _parse_url(url)
+    m = _ROW_FRAGMENT_RE.search(parsed.fragment or "")
     if not m:
         return None
     return int(m.group(1))
 
 
+# Per-call timeout budget (seconds) set by fetch_job_content and
+# extract_html_description; a ContextVar so concurrent job threads each see
+# their own. None keeps the module defaults.
+_FETCH_TIMEOUT: ContextVar[float | None] = ContextVar("fetch_timeout", default=None)
+_CONNECT_TIMEOUT = 5.0
+
+
+@contextmanager
+def _fetch_timeout(seconds: float | None):
+    """Bound every HTTP read and browser wait inside the block by seconds.
+
+    These are transport-level timeouts (requests' (connect, read) tuple and
+    Playwright's navigation timeout), so they work off the main thread.
+    """
+    if not seconds or seconds <= 0:
+        yield
+        return
+    token = _FETCH_TIMEOUT.set(seconds)
+    try:
+        yield
+    finally:
+        _FETCH_TIMEOUT.reset(token)
+
+
+def _http_timeout() -> float | tuple[float, float]:
+    seconds = _FETCH_TIMEOUT.get()
+    if seconds is None:
+        return REQUEST_TIMEOUT
+    return (min(_CONNECT_TIMEOUT, seconds), seconds)
+
+
+def _browser_timeout_ms(default_ms: int) -> int:
+    seconds = _FETCH_TIMEOUT.get()
+    return default_ms if seconds is None else int(seconds * 1000)
+
+
 def _request(url: str, method: str = "GET", **kwargs):
     return fetch(
         url,
         method=method,
         headers=kwargs.pop("headers", DEFAULT_HEADERS),
-        timeout=kwargs.pop("timeout", REQUEST_TIMEOUT),
+        timeout=kwargs.pop("timeout", None) or _http_timeout(),
         verify=_verify_ssl(url),
         **kwargs,
     )
 
 
-def detect_content_type(url: str) -> str:
-    """Detect whether a URL points to a PDF or HTML page.
+def _get_json(api_url: str, accept: str):
+    """GET a JSON API endpoint on the pooled session and decode the body."""
+    with _FETCH_SLOTS:
+        resp = _session().get(
+            api_url,
+            headers={"Accept": accept},
+            timeout=_http_timeout(),
+            verify=_verify_ssl(api_url),
+        )
+        resp.raise_for_status()
+        return jsonio.loads(resp.content)
+
 
-    Returns 'pdf' or 'html'.
+def _fetch_html(url: str, max_bytes: int = MAX_HTML_BYTES) -> str:
+    """GET a page and return its text, reading at most max_bytes of body.
+
+    Pathologically large pages are cut off mid-stream instead of being
+    downloaded in full and truncated after parsing.
     """
-    if url.lower().endswith(".pdf"):
-        return "pdf"
+    with _FETCH_SLOTS:
+        resp = _request(url, stream=True)
+        try:
+            chunks = []
+            size = 0
+            for chunk in resp.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= max_bytes:
+                    break
+        finally:
+            resp.close()
+    body = b"".join(chunks)[:max_bytes]
+    return body.decode(resp.encoding or "utf-8", errors="replace")
+
+
+# Hosts seen rejecting HEAD; content type is sniffed from a streamed GET.
+_NO_HEAD_HOSTS: set[str] = set()
+
+# url -> (expires_at, content_type). Only successful probes are cached so a
+# transient failure does not pin a PDF candidate to "html".
+_CONTENT_TYPE_TTL = 3600.0
+_CONTENT_TYPE_CACHE: dict[str, tuple[float, str]] = {}
+_CONTENT_TYPE_LOCK = threading.Lock()
+
+
+def _probe_content_type(url: str) -> str | None:
+    """HEAD (or streamed GET) url; return 'pdf'/'html', or None on failure."""
+    host = _url_host(url)
+    if host not in _NO_HEAD_HOSTS:
+        try:
+            resp = _request(url, method="HEAD")
+            ct = resp.headers.get("Content-Type", "").lower()
+            return "pdf" if "application/pdf" in ct else "html"
+        except requests.HTTPError as exc:
+            status = getattr(exc.response, "status_code", None)
+            if status not in (403, 405, 501):
+                return None
+            _NO_HEAD_HOSTS.add(host)
+        except Exception:
+            return None
 
     try:
-        resp = _request(url, method="HEAD")
-        ct = resp.headers.get("Content-Type", "").lower()
-        if "application/pdf" in ct:
-            return "pdf"
+        resp = _request(url, stream=True)
+        try:
+            ct = resp.headers.get("Content-Type", "").lower()
+        finally:
+            resp.close()
     except Exception:
-        pass
+        return None
+    return "pdf" if "application/pdf" in ct else "html"
+
 
-    return "html"
+# Platforms whose job pages are always HTML (their extractors read an API or
+# embedded JSON), so a HEAD probe would only add a round trip.
+_HTML_ONLY_PLATFORMS = frozenset({"platform_a", "api_v1", "api_v2", "nextjs"})
+
+
+@functools.lru_cache(maxsize=8192)
+def _is_html_only_url(url: str) -> bool:
+    return bool(_HTML_ONLY_PLATFORMS & _host_platforms(_url_host(url))) or (
+        _is_legacy_ats_url(url)
+    )
+
+
+def detect_content_type(url: str) -> str:
+    """Detect whether a URL points to a PDF or HTML page.
+
+    Returns 'pdf' or 'html'. Results are cached per URL for an hour.
+    """
+    if _PDF_SUFFIX_RE.search(url):
+        return "pdf"
+    if _is_html_only_url(url):
+        return "html"
+
+    now = time.monotonic()
+    with _CONTENT_TYPE_LOCK:
+        hit = _CONTENT_TYPE_CACHE.get(url)
+    if hit and hit[0] > now:
+        return hit[1]
+
+    with _FETCH_SLOTS:
+        content_type = _probe_content_type(url)
+    if content_type is None:
+        return "html"
+    with _CONTENT_TYPE_LOCK:
+        if len(_CONTENT_TYPE_CACHE) >= 4096:
+            _CONTENT_TYPE_CACHE.clear()
+        _CONTENT_TYPE_CACHE[url] = (now + _CONTENT_TYPE_TTL, content_type)
+    return content_type
 
 
 def download_pdf(url: str, org_abbrev: str, title: str, run_id: str = "default") -> str:
     """Download a PDF and return its relative path from project root.
 
-    Saves to ops/runs/{run_id}/pdfs/{org_abbrev}/{slug}-{date}.pdf.
-    Deletes partial downloads on failure.
+    Saves to ops/runs/{run_id}/pdfs/{org_abbrev}/{slug}-{date}.pdf. The body
+    is streamed into a temp file next to the target and moved into place only
+    once complete, so a failed download never leaves a partial PDF behind.
     """
     from .config import get_pdf_dir
 
@@ -164,28 +493,33 @@ def download_pdf(url: str, org_abbrev: str, title: str, run_id: str = "default")
     slug = slugify(title)
     filename = f"{slug}-{date.today().isoformat()}.pdf"
     filepath = org_dir / filename
+    fd, tmp_name = tempfile.mkstemp(dir=org_dir, prefix=f".{slug}-", suffix=".part")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
 
     try:
-        resp = requests.get(
-            url,
-            headers=DEFAULT_HEADERS,
-            stream=True,
-            timeout=REQUEST_TIMEOUT,
-            verify=_verify_ssl(url),
-        )
-        resp.raise_for_status()
+        with _FETCH_SLOTS:
+            resp = _session().get(
+                url,
+                stream=True,
+                timeout=_http_timeout(),
+                verify=_verify_ssl(url),
+            )
+            resp.raise_for_status()
 
-        with open(filepath, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
+            # Copy the raw stream in C-level 256 KiB reads; decode_content
+            # keeps gzip/deflate transfer encodings transparent.
+            resp.raw.decode_content = True
+            with open(tmp_path, "wb") as f:
+                shutil.copyfileobj(resp.raw, f, length=256 * 1024)
+        os.replace(tmp_path, filepath)
 
         from .config import PROJECT_ROOT
 
         return str(filepath.relative_to(PROJECT_ROOT))
     except Exception:
-        # Clean up partial download
-        if filepath.exists():
-            filepath.unlink()
+        # Only the temp file can be partial; the target is replaced atomically.
+        tmp_path.unlink(missing_ok=True)
         raise
 
 
@@ -205,18 +539,16 @@ def _download_table_row_pdf(
     filename = f"{slugify(title)}-{date.today().isoformat()}.pdf"
     filepath = org_dir / filename
 
-    sys.path.insert(
-        0, str(Path(__file__).resolve().parent.parent / "scrapers_playwright")
-    )
-    from playwright.sync_api import sync_playwright
-
     base_url = url.split("#", 1)[0]
     button_id = f"VACANCYNTGPAST\\${row_idx}"
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(ignore_https_errors=True, accept_downloads=True)
+    with PLAYWRIGHT_POOL.context(
+        ignore_https_errors=True, accept_downloads=True
+    ) as context:
+        context.set_default_timeout(_browser_timeout_ms(30000))
         page = context.new_page()
-        page.goto(base_url, wait_until="domcontentloaded", timeout=60000)
+        page.goto(
+            base_url, wait_until="domcontentloaded", timeout=_browser_timeout_ms(60000)
+        )
         page.wait_for_timeout(2500)
         target_frame = None
         for frame in page.frames:
@@ -228,14 +560,12 @@ def _download_table_row_pdf(
                 target_frame = frame
                 break
         if target_frame is None:
-            browser.close()
             raise RuntimeError("table_frame_not_found")
 
-        with page.expect_download(timeout=45000) as dl_info:
+        with page.expect_download(timeout=_browser_timeout_ms(45000)) as dl_info:
             target_frame.locator(f"#{button_id}").click()
         download = dl_info.value
         download.save_as(str(filepath))
-        browser.close()
 
     if not filepath.exists() or filepath.stat().st_size == 0:
         raise RuntimeError("table_pdf_download_failed")
@@ -245,6 +575,7 @@ def _download_table_row_pdf(
     return str(filepath.relative_to(PROJECT_ROOT))
 
 
+@functools.lru_cache(maxsize=8192)
 def _is_legacy_ats_url(url: str) -> bool:
     """Check if a URL is a legacy ATS (Applicant Tracking System) job detail page.
 
@@ -254,38 +585,118 @@ def _is_legacy_ats_url(url: str) -> bool:
     return "/careersection/" in lowered and "jobdetail.ftl" in lowered
 
 
+def _best_legacy_fragment(decoded: str) -> str:
+    """Return the best-scoring `!|!!*!...` payload fragment as plain text.
+
+    Some legacy ATS variants embed description sections in one or more
+    such fragments; each is scored and the best one kept.
+    """
+    keyword_markers = (
+        "organizational setting",
+        "minimum requirements",
+        "technical skills",
+        "responsibilities",
+        "duties and responsibilities",
+        "selection criteria",
+        "job purpose",
+        "qualifications",
+        "required skills",
+    )
+    noise_markers = (
+        "important notice",
+        "how to apply",
+        "additional information",
+        "apply now",
+    )
+
+    best_html = ""
+    best_score = -1
+    parts = decoded.split(_LEGACY_FRAGMENT_MARKER)[1:]
+    for part in parts:
+        # split() already ended the part at the next section marker; also
+        # end it at a job-id delimiter.
+        job_delim = _LEGACY_JOB_DELIM_RE.search(part)
+        fragment_html = part[: job_delim.start()] if job_delim else part
+
+        # Score on a regex tag strip; only the winner gets a DOM parse.
+        words = unescape(_TAG_RE.sub(" ", fragment_html)).split()
+        if not words:
+            continue
+
+        lowered = " ".join(words).lower()
+        marker_hits = sum(1 for k in keyword_markers if k in lowered)
+        noise_hits = sum(1 for k in noise_markers if k in lowered)
+
+        # Prefer substantive sections and strongly prefer known JD markers.
+        score = len(words) + (marker_hits * 400) - (noise_hits * 120)
+        if score > best_score:
+            best_score = score
+            best_html = fragment_html
+
+    if best_html:
+        best_text = BeautifulSoup(best_html, _HTML_PARSER).get_text("\n", strip=True)
+        best_text = _BLANK_LINES_RE.sub("\n\n", best_text)
+        best_text = best_text.replace("\\:", ":").replace("\\;", ";").strip()
+        if best_text:
+            return best_text[:MAX_DESCRIPTION_CHARS]
+
+    return ""
+
+
+def _singleview_text(soup: BeautifulSoup) -> str | None:
+    """Text of the div.singleview container, or None when there is none.
+
+    The container holds the rendered job description for all legacy ATS
+    template variants (MsoNormal-based and plain-span-based).
+    """
+    container = soup.find("div", class_="singleview")
+    if not container:
+        return None
+    for tag in container.find_all(["script", "style"]):
+        tag.decompose()
+    text = container.get_text("\n", strip=True)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+    text = text.replace("\\:", ":").replace("\\;", ";")
+    return text[:MAX_DESCRIPTION_CHARS]
+
+
 def _extract_legacy_ats_description(html: str) -> str:
     """Extract job description from a legacy ATS detail page.
 
     These pages store content URL-encoded in JS. After decoding, the
     job detail lives inside a div.singleview container or requisitionDescription.
     """
-    decoded = unquote(html)
-    soup = BeautifulSoup(decoded, "html.parser")
+    # A singleview container that is already real markup needs no decoding.
+    if _SINGLEVIEW_MARKUP_RE.search(html):
+        text = _singleview_text(BeautifulSoup(html, _HTML_PARSER))
+        if text is not None:
+            return text
+
+    # unquote is a no-op without "%", and most pages carry neither legacy
+    # container, so skip the DOM build unless one can actually match.
+    decoded = unquote(html) if "%" in html else html
+    if "singleview" not in decoded and not _REQUISITION_DESC_RE.search(decoded):
+        if _LEGACY_FRAGMENT_MARKER not in decoded:
+            return ""
+        return _best_legacy_fragment(decoded)
 
-    # The singleview div contains the rendered job description for all
-    # legacy ATS template variants (MsoNormal-based and plain-span-based).
-    container = soup.find("div", class_="singleview")
-    if container:
-        for tag in container.find_all(["script", "style"]):
-            tag.decompose()
-        text = container.get_text("\n", strip=True)
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        text = text.replace("\\:", ":").replace("\\;", ";")
-        return text[:MAX_DESCRIPTION_CHARS]
+    soup = BeautifulSoup(decoded, _HTML_PARSER)
+    text = _singleview_text(soup)
+    if text is not None:
+        return text
 
     # Alternative template variant: content under requisitionDescription
     # with MsoNormal paragraphs.
-    req = soup.find(id=re.compile(r"requisitionDescription", re.I))
+    req = soup.find(id=_REQUISITION_DESC_RE)
     if req:
         mso_lines = []
-        for node in req.find_all(class_=re.compile(r"MsoNormal", re.I)):
+        for node in req.find_all(class_=_MSO_NORMAL_RE):
             line = node.get_text(" ", strip=True)
             if line and len(line) > 15:
                 mso_lines.append(line)
         if mso_lines:
             text = "\n".join(mso_lines)
-            text = re.sub(r"\n{3,}", "\n\n", text)
+            text = _BLANK_LINES_RE.sub("\n\n", text)
             text = text.replace("\\:", ":").replace("\\;", ";")
             return text[:MAX_DESCRIPTION_CHARS]
 
@@ -294,242 +705,305 @@ def _extract_legacy_ats_description(html: str) -> str:
             req_text = req_text.replace("\\:", ":").replace("\\;", ";")
             return req_text[:MAX_DESCRIPTION_CHARS]
 
-    # Some legacy ATS variants embed description sections in one or more
-    # `!|!!*!...` payload fragments. We score each fragment and keep the best.
-    marker = "!|!!*!"
-    if marker in decoded:
-        keyword_markers = (
-            "organizational setting",
-            "minimum requirements",
-            "technical skills",
-            "responsibilities",
-            "duties and responsibilities",
-            "selection criteria",
-            "job purpose",
-            "qualifications",
-            "required skills",
-        )
-        noise_markers = (
-            "important notice",
-            "how to apply",
-            "additional information",
-            "apply now",
-        )
+    if _LEGACY_FRAGMENT_MARKER in decoded:
+        return _best_legacy_fragment(decoded)
+    return ""
 
-        best_text = ""
-        best_score = -1
-        parts = decoded.split(marker)[1:]
-        for part in parts:
-            # End fragment at the next known section or job-id delimiter.
-            cut_points = []
-            next_marker = part.find(marker)
-            if next_marker != -1:
-                cut_points.append(next_marker)
-            job_delim = re.search(r"!\|!\d{6,8}!\|!", part)
-            if job_delim:
-                cut_points.append(job_delim.start())
-            fragment_html = part[: min(cut_points)] if cut_points else part
-
-            fragment_text = BeautifulSoup(fragment_html, "html.parser").get_text(
-                "\n", strip=True
-            )
-            fragment_text = re.sub(r"\n{3,}", "\n\n", fragment_text)
-            fragment_text = (
-                fragment_text.replace("\\:", ":").replace("\\;", ";").strip()
-            )
-            if not fragment_text:
-                continue
 
-            lowered = fragment_text.lower()
-            words = len(fragment_text.split())
-            marker_hits = sum(1 for k in keyword_markers if k in lowered)
-            noise_hits = sum(1 for k in noise_markers if k in lowered)
+def _parse_and_extract(url: str, html: str) -> tuple[str, bool]:
+    """Run the HTML-only extraction cascade; no network I/O.
 
-            # Prefer substantive sections and strongly prefer known JD markers.
-            score = words + (marker_hits * 400) - (noise_hits * 120)
-            if score > best_score:
-                best_score = score
-                best_text = fragment_text
+    Returns (text, structured): structured is True when the text came from
+    a Next.js payload or legacy ATS container and needs no further checks.
+    """
+    if "nextjs" in _host_platforms(_url_host(url)):
+        nextjs_desc = _extract_nextjs_description_from_html(url, html)
+        if nextjs_desc:
+            return nextjs_desc, True
 
-        if best_text:
-            return best_text[:MAX_DESCRIPTION_CHARS]
+    # Legacy ATS pages need special handling (content is URL-encoded in JS)
+    if _is_legacy_ats_url(url):
+        result = _extract_legacy_ats_description(html)
+        if result:
+            return result, True
 
-    return ""
+    return _parse_html(html), False
 
 
-def extract_html_description(url: str, use_playwright: bool = False) -> str:
+def extract_html_description(
+    url: str,
+    use_playwright: bool = False,
+    html: str | None = None,
+    timeout: float | None = None,
+) -> str:
     """Fetch a page and extract the main text content.
 
+    Pass html when the page body has already been fetched to skip the GET.
+    timeout (seconds) bounds each HTTP read and browser wait; see _fetch_timeout.
     Returns cleaned text capped at MAX_DESCRIPTION_CHARS.
     """
-    if use_playwright:
-        return _extract_with_playwright(url)
-
-    api_v2_desc = _extract_api_based_description_v2(url)
-    if api_v2_desc:
-        return api_v2_desc
-
-    platform_a_desc = _extract_platform_a_description(url)
-    if platform_a_desc:
-        return platform_a_desc
-
-    api_v1_desc = _extract_api_based_description_v1(url)
-    if api_v1_desc:
-        return api_v1_desc
-
-    resp = _request(url)
-    nextjs_desc = _extract_nextjs_description_from_html(url, resp.text)
-    if nextjs_desc:
-        return nextjs_desc
-
-    # Legacy ATS pages need special handling (content is URL-encoded in JS)
-    if _is_legacy_ats_url(url):
-        result = _extract_legacy_ats_description(resp.text)
-        if result:
-            return result
-
-    parsed = _parse_html(resp.text)
-    if _is_short_or_placeholder(parsed):
-        pdf_link = _find_embedded_pdf_link(resp.text, url)
-        if pdf_link:
-            return ""
-        if not use_playwright and _should_try_playwright(url, parsed, resp.text):
-            try:
-                parsed_pw = _extract_with_playwright(url)
-                if len(parsed_pw) > len(parsed):
-                    return parsed_pw
-            except Exception:
-                pass
-    return parsed
+    with _fetch_timeout(timeout):
+        if use_playwright:
+            return _extract_with_playwright(url)
+
+        platforms = _host_platforms(_url_host(url))
+        for platform, extract in _API_EXTRACTORS:
+            if platform in platforms:
+                desc = extract(url)
+                if desc:
+                    return desc
+
+        if html is None:
+            html = _fetch_html(url)
+        parsed, structured = _parse_and_extract(url, html)
+        if structured:
+            return parsed
+
+        if _is_short_or_placeholder(parsed):
+            pdf_link = _find_embedded_pdf_link(html, url)
+            if pdf_link:
+                return ""
+            if not use_playwright and _should_try_playwright(url, parsed, html):
+                try:
+                    parsed_pw = _extract_with_playwright(url)
+                    if len(parsed_pw) > len(parsed):
+                        return parsed_pw
+                except Exception:
+                    pass
+        return parsed
 
 
 def _extract_with_playwright(url: str) -> str:
     """Extract description using Playwright for JS-heavy pages."""
-    sys.path.insert(
-        0, str(Path(__file__).resolve().parent.parent / "scrapers_playwright")
-    )
-    from playwright.sync_api import sync_playwright
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(user_agent=USER_AGENT)
-        page.goto(url, wait_until="domcontentloaded", timeout=45000)
+    with PLAYWRIGHT_POOL.context(user_agent=USER_AGENT) as ctx:
+        ctx.set_default_timeout(_browser_timeout_ms(30000))
+        page = ctx.new_page()
+        page.goto(
+            url, wait_until="domcontentloaded", timeout=_browser_timeout_ms(45000)
+        )
         try:
             page.wait_for_load_state("networkidle", timeout=12000)
         except Exception:
             pass
         page.wait_for_timeout(4500)
         html = page.content()
-        browser.close()
 
     return _parse_html(html)
 
 
-def _parse_html(html: str) -> str:
-    """Parse HTML and extract the main descriptive text."""
-    soup = BeautifulSoup(html, "html.parser")
+# Containers that only ever hold the posting body: a long enough match is
+# returned as soon as it is seen. The broad selectors after them (and "body"
+# last) are only consulted while nothing reaches 250 chars.
+_TRUSTED_SELECTORS = (
+    "[itemprop='description']",
+    "[data-careersite-propertyid='description']",
+    ".jobdescription",
+    "div.gestmax-container",
+    "div.gestmax-template-container",
+    "div#requisitionDescription",
+    "div#requisitionDescriptionInterface",
+)
+_CONTAINER_SELECTORS = _TRUSTED_SELECTORS + (
+    "article",
+    "main",
+    "[class*='job-description']",
+    "[id*='job-description']",
+    "[class*='description']",
+    "[id*='description']",
+)
+_TRUSTED_MIN_CHARS = 400
+_NOISE_TAGS = ("script", "style", "nav", "header", "footer")
+
+
+if ElementFilter is not None:
+
+    class _ContainerFilter(ElementFilter):
+        """Build only subtrees some container selector could match.
+
+        Top-level noise tags are kept too so that containers nested in them
+        are decomposed along with them, as in a full parse.
+        """
+
+        def allow_tag_creation(self, nsprefix, name, attrs):
+            if name in ("article", "main") or name in _NOISE_TAGS:
+                return True
+            if not attrs:
+                return False
+            if "description" in (
+                attrs.get("itemprop"),
+                attrs.get("data-careersite-propertyid"),
+            ):
+                return True
+            classes = attrs.get("class") or ""
+            if not isinstance(classes, str):
+                classes = " ".join(classes)
+            return (
+                "description" in classes
+                or "gestmax-" in classes
+                or "description" in (attrs.get("id") or "").lower()
+            )
 
-    # Remove noise elements
-    for tag in soup.find_all(["script", "style", "nav", "header", "footer"]):
+        def allow_string_creation(self, string):
+            return False
+
+    _CONTAINER_FILTER = _ContainerFilter()
+else:
+    _CONTAINER_FILTER = None
+
+
+def _description_soup(html: str, parse_only=None) -> BeautifulSoup:
+    soup = BeautifulSoup(html, _HTML_PARSER, parse_only=parse_only)
+    for tag in soup.find_all(_NOISE_TAGS):
         tag.decompose()
+    return soup
 
-    selector_candidates = [
-        "[itemprop='description']",
-        "[data-careersite-propertyid='description']",
-        ".jobdescription",
-        "div.gestmax-container",
-        "div.gestmax-template-container",
-        "div#requisitionDescription",
-        "div#requisitionDescriptionInterface",
-        "article",
-        "main",
-        "[class*='job-description']",
-        "[id*='job-description']",
-        "[class*='description']",
-        "[id*='description']",
-        "body",
-    ]
 
-    best_text = ""
-    for selector in selector_candidates:
-        for node in soup.select(selector):
-            text = node.get_text("\n", strip=True)
-            text = _clean_text(text)
+def _soup_texts(soup: BeautifulSoup):
+    return lambda selector: (
+        node.get_text("\n", strip=True) for node in soup.select(selector)
+    )
+
+
+def _best_selector_text(node_texts, selectors, best_text: str = "") -> str:
+    """Pick the longest cleaned text across selectors, in priority order.
+
+    node_texts(selector) yields the raw text of each node the selector
+    matches, so the same ranking serves both the selectolax and bs4 trees.
+    """
+    for selector in selectors:
+        trusted = selector in _TRUSTED_SELECTORS
+        for raw in node_texts(selector):
+            text = _clean_text(raw)
+            if trusted and len(text) >= _TRUSTED_MIN_CHARS:
+                return text
             if len(text) > len(best_text):
                 best_text = text
         if len(best_text) >= 250:
             break
+    return best_text
 
+
+def _parse_html(html: str) -> str:
+    """Parse HTML and extract the main descriptive text."""
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        for node in tree.css(",".join(_NOISE_TAGS)):
+            node.decompose()
+        best_text = _best_selector_text(
+            lambda selector: (
+                node.text(separator="\n", strip=True) for node in tree.css(selector)
+            ),
+            _CONTAINER_SELECTORS + ("body",),
+        )
+        return best_text[:MAX_DESCRIPTION_CHARS]
+
+    if _CONTAINER_FILTER is None:
+        soup = _description_soup(html)
+        best_text = _best_selector_text(
+            _soup_texts(soup), _CONTAINER_SELECTORS + ("body",)
+        )
+        return best_text[:MAX_DESCRIPTION_CHARS]
+
+    # Most pages have a usable container, so parse just those subtrees and
+    # only build the full tree when falling back to the whole body.
+    soup = _description_soup(html, parse_only=_CONTAINER_FILTER)
+    best_text = _best_selector_text(_soup_texts(soup), _CONTAINER_SELECTORS)
+    if len(best_text) < 250:
+        best_text = _best_selector_text(
+            _soup_texts(_description_soup(html)), ("body",), best_text
+        )
     return best_text[:MAX_DESCRIPTION_CHARS]
 
 
+_NEXTJS_DESCRIPTION_PATHS = (
+    ("props", "pageProps", "job", "description"),
+    ("props", "pageProps", "job", "jobDescription"),
+    ("props", "pageProps", "jobPosting", "description"),
+    ("props", "pageProps", "description"),
+)
+
+
+def _dig(data, keys):
+    """Follow keys through nested dicts; None when any step is missing."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _nextjs_leaf_text(value: str) -> str:
+    if "<" in value or "&" in value:
+        value = BeautifulSoup(value, _HTML_PARSER).get_text("\n", strip=True)
+    return _clean_text(value.strip())
+
+
+def _is_nextjs_noise(lowered: str) -> bool:
+    return bool(_NEXTJS_NOISE_RE.search(lowered)) or (
+        "job list" in lowered and "confirm" in lowered
+    )
+
+
 def _extract_nextjs_description_from_html(url: str, html: str) -> str:
     """Extract job description from Next.js application payloads.
 
     Some platforms embed JSON data in __NEXT_DATA__ script tags.
     """
-    host = _url_host(url)
-    if not any(platform in host for platform in NEXTJS_PLATFORMS):
+    if "nextjs" not in _host_platforms(_url_host(url)):
         return ""
 
-    soup = BeautifulSoup(html, "html.parser")
-    data_tag = soup.find("script", id="__NEXT_DATA__")
-    if not data_tag or not data_tag.string:
+    # Pull the payload out with a regex rather than a DOM parse: it is one
+    # script tag, and lxml would end the script at any "</" inside the JSON.
+    match = _NEXT_DATA_RE.search(html)
+    if not match or not match.group(1).strip():
         return ""
 
     try:
-        data = json.loads(data_tag.string)
+        data = jsonio.loads(match.group(1))
     except Exception:
         return ""
 
-    key_markers = (
-        "description",
-        "jobdescription",
-        "job_description",
-        "responsibil",
-        "profile",
-        "qualification",
-        "requirement",
-        "offer",
-        "about",
-    )
-    noise_markers = (
-        "job list",
-        "please confirm this action",
-        "privacy policy",
-        "imprint",
-        "navigation",
-    )
+    # Common page shapes keep the posting at a known key; a clean hit there
+    # would win the walk anyway (+250 for the key), so skip the walk.
+    for keys in _NEXTJS_DESCRIPTION_PATHS:
+        node = _dig(data, keys)
+        if not isinstance(node, str) or len(node) < 180:
+            continue
+        candidate = _nextjs_leaf_text(node)
+        if len(candidate) >= 180 and not _is_nextjs_noise(candidate.lower()):
+            return candidate[:MAX_DESCRIPTION_CHARS]
 
     best_text = ""
     best_score = -1
 
-    def _walk(node: object, path: str = "") -> None:
-        nonlocal best_text, best_score
+    # Iterative pre-order walk (children pushed in reverse) so leaves are
+    # scored in the same order as a recursive walk; ties keep the first.
+    stack: list[tuple[object, str]] = [(data, "")]
+    while stack:
+        node, path = stack.pop()
         if isinstance(node, dict):
-            for k, v in node.items():
-                next_path = f"{path}.{k}".lower() if path else str(k).lower()
-                _walk(v, next_path)
-            return
+            prefix = f"{path}." if path else ""
+            stack.extend(
+                (v, prefix + str(k).lower()) for k, v in reversed(node.items())
+            )
+            continue
         if isinstance(node, list):
-            for item in node:
-                _walk(item, path)
-            return
-        if not isinstance(node, str):
-            return
-
-        candidate = _clean_text(
-            BeautifulSoup(node, "html.parser").get_text("\n", strip=True)
-        )
+            stack.extend((item, path) for item in reversed(node))
+            continue
+        # Extracted text is never longer than its source string.
+        if not isinstance(node, str) or len(node) < 180:
+            continue
+
+        candidate = _nextjs_leaf_text(node)
         if len(candidate) < 180:
-            return
+            continue
 
         lowered = candidate.lower()
         words = len(candidate.split())
         score = words
-        if any(m in path for m in key_markers):
+        if _NEXTJS_KEY_RE.search(path):
             score += 250
-        if any(m in lowered for m in noise_markers):
+        if _NEXTJS_NOISE_RE.search(lowered):
             score -= 500
         if "job list" in lowered and "confirm" in lowered:
             score -= 500
@@ -537,24 +1011,16 @@ def _extract_nextjs_description_from_html(url: str, html: str) -> str:
             best_score = score
             best_text = candidate
 
-    _walk(data)
     if best_score < 80:
         return ""
     return best_text[:MAX_DESCRIPTION_CHARS]
 
 
 def _clean_text(text: str) -> str:
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
     text = text.replace("\\:", ":").replace("\\;", ";")
     lines = [ln.strip() for ln in text.splitlines()]
-    noise = {
-        "view profile",
-        "employee login",
-        "create/ view profile",
-        "language",
-        "loading",
-    }
-    filtered = [ln for ln in lines if ln and ln.lower() not in noise]
+    filtered = [ln for ln in lines if ln and not _NOISE_LINE_RE.fullmatch(ln)]
     return "\n".join(filtered).strip()
 
 
@@ -564,9 +1030,9 @@ def _extract_platform_a_description(url: str) -> str:
     These sites use a specific URL structure: /job/{slug}
     and provide JSON APIs at /wday/cxs/{tenant}/{site}/job/{slug}
     """
-    parsed = urlparse(url)
+    parsed = _parse_url(url)
     host = parsed.netloc.lower()
-    if not any(domain in host for domain in PLATFORM_A_DOMAINS):
+    if "platform_a" not in _host_platforms(host):
         return ""
 
     path = parsed.path.rstrip("/")
@@ -582,7 +1048,7 @@ def _extract_platform_a_description(url: str) -> str:
         return ""
 
     site = parts[job_idx - 1]
-    if re.fullmatch(r"[a-z]{2}-[a-z]{2}", site, flags=re.I) and job_idx >= 2:
+    if _LOCALE_RE.fullmatch(site) and job_idx >= 2:
         site = parts[job_idx - 2]
     slug = "/".join(parts[job_idx + 1 :])
     if not slug:
@@ -592,14 +1058,7 @@ def _extract_platform_a_description(url: str) -> str:
     api_url = f"{parsed.scheme}://{parsed.netloc}/wday/cxs/{tenant}/{site}/job/{slug}"
 
     try:
-        resp = requests.get(
-            api_url,
-            headers={**DEFAULT_HEADERS, "Accept": "application/json"},
-            timeout=REQUEST_TIMEOUT,
-            verify=_verify_ssl(api_url),
-        )
-        resp.raise_for_status()
-        data = resp.json()
+        data = _get_json(api_url, "application/json")
     except Exception:
         return ""
 
@@ -611,49 +1070,62 @@ def _extract_platform_a_description(url: str) -> str:
     if not desc_html:
         return ""
 
-    soup = BeautifulSoup(desc_html, "html.parser")
+    soup = BeautifulSoup(desc_html, _HTML_PARSER)
     text = _clean_text(soup.get_text("\n", strip=True))
     return text[:MAX_DESCRIPTION_CHARS]
 
 
+# api_url -> (expires_at, {jobVacancyId: row}). Every posting on a tenant
+# shares one vacancy list, so it is downloaded once rather than per job.
+_VACANCY_LIST_TTL = 600.0
+_VACANCY_LIST_CACHE: dict[str, tuple[float, dict]] = {}
+_VACANCY_LIST_LOCK = threading.Lock()
+
+
+def _vacancy_index(api_url: str) -> dict:
+    """Return the tenant's current vacancies keyed by jobVacancyId.
+
+    Failed or malformed responses return {} and are not cached.
+    """
+    now = time.monotonic()
+    with _VACANCY_LIST_LOCK:
+        hit = _VACANCY_LIST_CACHE.get(api_url)
+    if hit and hit[0] > now:
+        return hit[1]
+
+    try:
+        data = _get_json(api_url, "application/json, text/plain, */*")
+    except Exception:
+        return {}
+
+    if not isinstance(data, list):
+        return {}
+    index = {}
+    for row in data:
+        if isinstance(row, dict):
+            # First row wins, as with the previous linear scan.
+            index.setdefault(row.get("jobVacancyId"), row)
+    with _VACANCY_LIST_LOCK:
+        _VACANCY_LIST_CACHE[api_url] = (now + _VACANCY_LIST_TTL, index)
+    return index
+
+
 def _extract_api_based_description_v1(url: str) -> str:
     """Extract job description from API-based recruitment systems (variant 1).
 
     These systems expose a JSON API with job listings that can be matched by ID.
     """
-    parsed = urlparse(url)
+    parsed = _parse_url(url)
     host = parsed.netloc.lower()
-    if not any(domain in host for domain in API_BASED_V1_DOMAINS):
+    if "api_v1" not in _host_platforms(host):
         return ""
-    match = re.search(r"/vacancies/(\d+)", parsed.path)
+    match = _VACANCY_ID_RE.search(parsed.path)
     if not match:
         return ""
 
     job_id = int(match.group(1))
     api_url = f"{parsed.scheme}://{parsed.netloc}/api/CurrentJobVacancies"
-
-    try:
-        resp = requests.get(
-            api_url,
-            headers={**DEFAULT_HEADERS, "Accept": "application/json, text/plain, */*"},
-            timeout=REQUEST_TIMEOUT,
-            verify=_verify_ssl(api_url),
-        )
-        resp.raise_for_status()
-        data = resp.json()
-    except Exception:
-        return ""
-
-    if not isinstance(data, list):
-        return ""
-    match_item = next(
-        (
-            row
-            for row in data
-            if isinstance(row, dict) and row.get("jobVacancyId") == job_id
-        ),
-        None,
-    )
+    match_item = _vacancy_index(api_url).get(job_id)
     if not match_item:
         return ""
 
@@ -666,7 +1138,7 @@ def _extract_api_based_description_v1(url: str) -> str:
     merged = "\n".join(x for x in html_fields if isinstance(x, str) and x.strip())
     if not merged:
         return ""
-    soup = BeautifulSoup(merged, "html.parser")
+    soup = BeautifulSoup(merged, _HTML_PARSER)
     text = _clean_text(soup.get_text("\n", strip=True))
     return text[:MAX_DESCRIPTION_CHARS]
 
@@ -676,11 +1148,11 @@ def _extract_api_based_description_v2(url: str) -> str:
 
     These systems use RESTful APIs with UUID-based vacancy endpoints.
     """
-    parsed = urlparse(url)
+    parsed = _parse_url(url)
     host = parsed.netloc.lower()
-    if not any(domain in host for domain in API_BASED_V2_DOMAINS):
+    if "api_v2" not in _host_platforms(host):
         return ""
-    match = re.search(r"/vacancy/([0-9a-f]{16,32})", parsed.path, flags=re.I)
+    match = _VACANCY_UUID_RE.search(parsed.path)
     if not match:
         return ""
 
@@ -688,14 +1160,7 @@ def _extract_api_based_description_v2(url: str) -> str:
     api_url = f"{parsed.scheme}://{parsed.netloc}/api/Vacancy/{vacancy_id}"
 
     try:
-        resp = requests.get(
-            api_url,
-            headers={**DEFAULT_HEADERS, "Accept": "application/json, text/plain, */*"},
-            timeout=REQUEST_TIMEOUT,
-            verify=_verify_ssl(api_url),
-        )
-        resp.raise_for_status()
-        data = resp.json()
+        data = _get_json(api_url, "application/json, text/plain, */*")
     except Exception:
         return ""
 
@@ -721,7 +1186,7 @@ def _api_payload_to_text(data: dict) -> str:
         if not isinstance(raw, str) or not raw.strip():
             continue
         section_text = _clean_text(
-            BeautifulSoup(raw, "html.parser").get_text("\n", strip=True)
+            BeautifulSoup(raw, _HTML_PARSER).get_text("\n", strip=True)
         )
         if section_text:
             sections.append(f"{heading}\n{section_text}")
@@ -735,13 +1200,88 @@ def _api_payload_to_text(data: dict) -> str:
     return ""
 
 
+# fetch_job_content sweeps the same page for both PDF candidate selection
+# and the embedded-link check. Sweeps are cached by a digest of the page so
+# the cache does not keep whole documents alive.
+_ANCHOR_SCANS: OrderedDict[bytes, tuple[tuple[str, str, str], ...] | None] = (
+    OrderedDict()
+)
+_ANCHOR_SCANS_LOCK = threading.Lock()
+_ANCHOR_SCANS_MAX = 4
+
+
+def _scan_anchors(html: str) -> tuple[tuple[str, str, str], ...] | None:
+    """Cached _sweep_anchors(html)."""
+    key = hashlib.blake2b(
+        html.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+    with _ANCHOR_SCANS_LOCK:
+        if key in _ANCHOR_SCANS:
+            _ANCHOR_SCANS.move_to_end(key)
+            return _ANCHOR_SCANS[key]
+    anchors = _sweep_anchors(html)
+    with _ANCHOR_SCANS_LOCK:
+        _ANCHOR_SCANS[key] = anchors
+        while len(_ANCHOR_SCANS) > _ANCHOR_SCANS_MAX:
+            _ANCHOR_SCANS.popitem(last=False)
+    return anchors
+
+
+def _sweep_anchors(html: str) -> tuple[tuple[str, str, str], ...] | None:
+    """Regex sweep of <a href> tags as (href, text, context) tuples.
+
+    Context is the tag-stripped text around the anchor up to the nearest
+    block or anchor boundary, standing in for the parent element's text.
+    Returns None when the page has anchors the regex could not make sense
+    of, so callers fall back to a full parse.
+    """
+    anchors = []
+    for m in _ANCHOR_RE.finditer(html):
+        href = unescape(next(g for g in m.group(1, 2, 3) if g is not None)).strip()
+        text = " ".join(unescape(_TAG_RE.sub(" ", m.group(4))).split())
+        before = html[max(0, m.start() - 400) : m.start()]
+        bounds = list(_BLOCK_BOUNDARY_RE.finditer(before))
+        if bounds:
+            before = before[bounds[-1].end() :]
+        after = html[m.end() : m.end() + 400]
+        bound = _BLOCK_BOUNDARY_RE.search(after)
+        if bound:
+            after = after[: bound.start()]
+        window = f"{before}{m.group(4)}{after}"
+        context = " ".join(unescape(_TAG_RE.sub(" ", window)).split())
+        anchors.append((href, text, context))
+    if not anchors and _ANCHOR_OPEN_RE.search(html):
+        return None
+    return tuple(anchors)
+
+
 def _find_embedded_pdf_link(html: str, page_url: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
+    # Both checks below need "pdf" in an href or link text.
+    if not _PDF_WORD_RE.search(html):
+        return ""
+    anchors = _scan_anchors(html)
+    if anchors is None:
+        return _find_embedded_pdf_link_soup(html, page_url)
+
+    for href, _text, _context in anchors:
+        if ".pdf" in href.lower():
+            return urljoin(page_url, href)
+
+    # Adequasys pages often expose "Download PDF" buttons without .pdf in URL.
+    for href, text, _context in anchors:
+        text = text.lower()
+        if "download pdf" in text or ("pdf" in text and "download" in text):
+            return urljoin(page_url, href)
+
+    return ""
+
+
+def _find_embedded_pdf_link_soup(html: str, page_url: str) -> str:
+    soup = BeautifulSoup(html, _HTML_PARSER)
     pdf_link = soup.find("a", href=lambda h: h and ".pdf" in h.lower())
     if pdf_link and pdf_link.get("href"):
         return urljoin(page_url, pdf_link["href"])
 
-    # Adequasys pages often expose "Download PDF" buttons without .pdf in URL.
     for link in soup.find_all("a", href=True):
         text = link.get_text(" ", strip=True).lower()
         if "download pdf" in text or ("pdf" in text and "download" in text):
@@ -750,76 +1290,103 @@ def _find_embedded_pdf_link(html: str, page_url: str) -> str:
     return ""
 
 
-def _extract_pdf_candidates(html: str, page_url: str) -> list[dict[str, str]]:
-    soup = BeautifulSoup(html, "html.parser")
-    candidates: list[dict[str, str]] = []
-    seen = set()
+def _stripped_text(element) -> str:
+    """lxml counterpart of bs4's get_text(" ", strip=True)."""
+    return " ".join(t.strip() for t in element.itertext() if t.strip())
 
+
+def _parsed_anchors(html: str) -> list[tuple[str, str, str]]:
+    if lxml_html is not None:
+        try:
+            root = lxml_html.fromstring(html)
+        except (ValueError, lxml_html.etree.ParserError):
+            root = None
+        if root is not None:
+            anchors = []
+            for element, attribute, _link, _pos in root.iterlinks():
+                if element.tag != "a" or attribute != "href":
+                    continue
+                parent = element.getparent()
+                anchors.append(
+                    (
+                        element.get("href", ""),
+                        _stripped_text(element),
+                        _stripped_text(parent) if parent is not None else "",
+                    )
+                )
+            return anchors
+
+    soup = BeautifulSoup(html, _HTML_PARSER)
+    anchors = []
     for link in soup.find_all("a", href=True):
-        href = link.get("href", "")
+        text = link.get_text(" ", strip=True)
+        context = link.parent.get_text(" ", strip=True) if link.parent else ""
+        anchors.append((link.get("href", ""), text, context))
+    return anchors
+
+
+class _PdfCandidate(NamedTuple):
+    url: str
+    text: str = ""
+    context: str = ""
+
+
+def _extract_pdf_candidates(html: str, page_url: str) -> list[_PdfCandidate]:
+    # Every candidate needs "pdf" in its href, link text or a raw URL.
+    if not _PDF_WORD_RE.search(html):
+        return []
+
+    candidates: list[_PdfCandidate] = []
+    seen = set()
+
+    anchors = _scan_anchors(html)
+    if anchors is None:
+        anchors = _parsed_anchors(html)
+    for href, text, context in anchors:
         if not href:
             continue
-        text = link.get_text(" ", strip=True)
-        lowered = (text + " " + href).lower()
+        href_lower = href.lower()
+        text_lower = text.lower()
         if (
-            ".pdf" not in href.lower()
-            and "pdf" not in text.lower()
-            and "download pdf" not in lowered
+            ".pdf" not in href_lower
+            and "pdf" not in text_lower
+            and "download pdf" not in f"{text_lower} {href_lower}"
         ):
             continue
         full = urljoin(page_url, href)
         if full in seen:
             continue
         seen.add(full)
-        context = link.parent.get_text(" ", strip=True) if link.parent else ""
-        candidates.append({"url": full, "text": text, "context": context[:400]})
+        candidates.append(_PdfCandidate(full, text, context[:400]))
 
     # Some sites (e.g. EBA careers) embed vacancy PDF URLs in JSON blobs
     # instead of rendering explicit anchor tags.
     normalized_html = html.replace("\\/", "/")
-    raw_urls = re.findall(
-        r'https?://[^\s"\'<>]+?\.pdf(?:\?[^\s"\'<>]*)?', normalized_html, flags=re.I
-    )
-    raw_urls += [
-        urljoin(page_url, p)
-        for p in re.findall(
-            r'/[^\s"\'<>]+?\.pdf(?:\?[^\s"\'<>]*)?', normalized_html, flags=re.I
-        )
-    ]
-    for full in raw_urls:
+    for match in _PDF_RAW_URL_RE.finditer(normalized_html):
+        full = match.group(0)
+        if full[0] == "/":
+            full = urljoin(page_url, full)
         if full in seen:
             continue
         seen.add(full)
-        candidates.append({"url": full, "text": "", "context": ""})
+        candidates.append(_PdfCandidate(full))
 
     return candidates
 
 
-def _score_pdf_candidate(candidate: dict[str, str], title: str) -> int:
-    url = candidate.get("url", "")
-    text = candidate.get("text", "")
-    context = candidate.get("context", "")
+def _score_pdf_candidate(candidate: _PdfCandidate, title_words: frozenset[str]) -> int:
+    url, text, context = candidate
     blob = f"{url} {text} {context}".lower()
+    url_lower = url.lower()
 
     score = 0
-    if ".pdf" in url.lower():
+    if ".pdf" in url_lower:
         score += 60
-    if "download" in blob:
-        score += 15
-
-    for marker in PDF_POSITIVE_MARKERS:
-        if marker in blob:
-            score += 45
-
-    for marker in PDF_NEGATIVE_MARKERS:
-        if marker in blob:
-            score -= 120
-    if ".docx" in url.lower() or ".doc" in url.lower():
+    # ".doc" also covers ".docx".
+    if ".doc" in url_lower:
         score -= 200
-    if "application form" in blob:
-        score -= 120
+    score += sum(weight for marker, weight in _PDF_MARKER_WEIGHTS if marker in blob)
 
-    title_words = _norm_words(title)
     blob_words = _norm_words(blob)
     overlap = len(title_words & blob_words)
     score += min(120, overlap * 20)
@@ -827,6 +1394,9 @@ def _score_pdf_candidate(candidate: dict[str, str], title: str) -> int:
     return score
 
 
+_PDF_PROBE_LIMIT = 3
+
+
 def _select_embedded_pdf_link(
     html: str, page_url: str, title: str, org_abbrev: str
 ) -> str:
@@ -834,18 +1404,23 @@ def _select_embedded_pdf_link(
     if not candidates:
         return ""
 
-    scored = sorted(
-        ((_score_pdf_candidate(c, title=title), c.get("url", "")) for c in candidates),
-        key=lambda x: x[0],
-        reverse=True,
-    )
+    title_words = _norm_words(title)
     threshold = 30 if (org_abbrev or "").upper() in PREFER_EMBEDDED_PDF_ORGS else 60
-    for best_score, best_url in scored:
-        if not best_url or best_score < threshold:
-            continue
-        if detect_content_type(best_url) != "pdf":
-            continue
-        return best_url
+    eligible = (
+        (score, url)
+        for c in candidates
+        if (url := c.url)
+        and (score := _score_pdf_candidate(c, title_words)) >= threshold
+    )
+    # Only the best few are worth a HEAD probe; on equal scores a ".pdf"
+    # URL goes first since detect_content_type answers it without a request.
+    for _, best_url in heapq.nlargest(
+        _PDF_PROBE_LIMIT,
+        eligible,
+        key=lambda x: (x[0], _PDF_SUFFIX_RE.search(x[1]) is not None),
+    ):
+        if detect_content_type(best_url) == "pdf":
+            return best_url
     return ""
 
 
@@ -853,20 +1428,25 @@ def _is_short_or_placeholder(text: str) -> bool:
     words = len((text or "").split())
     if len(text.strip()) < 120 or words < 50:
         return True
-    lowered = text.lower()
-    return any(marker in lowered for marker in JS_PLACEHOLDER_MARKERS)
+    return _JS_PLACEHOLDER_RE.search(text) is not None
+
+
+# Tried in this order; an empty result falls through to the next platform.
+_API_EXTRACTORS = (
+    ("api_v2", _extract_api_based_description_v2),
+    ("platform_a", _extract_platform_a_description),
+    ("api_v1", _extract_api_based_description_v1),
+)
 
 
 def _should_try_playwright(url: str, text: str, html: str) -> bool:
     """Determine if a URL requires JavaScript rendering (Playwright)."""
     host = _url_host(url)
-    if any(marker in text.lower() for marker in JS_PLACEHOLDER_MARKERS):
+    if _JS_PLACEHOLDER_RE.search(text):
         return True
-    if "oraclecloud" in host or any(domain in host for domain in PLAYWRIGHT_DOMAINS):
+    if "oraclecloud" in host or "playwright" in _host_platforms(host):
         return True
-    if "enable javascript" in html.lower():
-        return True
-    return False
+    return _ENABLE_JS_RE.search(html) is not None
 
 
 def classify_fetch_error(exc: Exception) -> tuple[str, str]:
@@ -891,94 +1471,100 @@ def fetch_job_content(
     title: str,
     use_playwright: bool = False,
     run_id: str = "default",
+    timeout: float | None = None,
 ) -> dict:
     """Fetch content for a single job URL.
 
+    timeout (seconds) bounds each HTTP read and browser wait; see _fetch_timeout.
     Returns dict with keys: content_type, description, pdf_path.
     """
-    if not url:
-        return {
-            "content_type": "error",
-            "description": "",
-            "pdf_path": "",
-            "enrich_status": "no_detail_url",
-            "status_reason": "missing_url",
-            "fetch_method": "none",
-        }
-
-    if _is_table_row_url(url):
-        pdf_path = _download_table_row_pdf(url, org_abbrev, title, run_id)
-        return {
-            "content_type": "pdf",
-            "description": "",
-            "pdf_path": pdf_path,
-            "enrich_status": "pdf",
-            "status_reason": "table_download_button",
-            "fetch_method": "playwright",
-        }
-
-    content_type = detect_content_type(url)
-
-    if content_type == "pdf":
-        pdf_path = download_pdf(url, org_abbrev, title, run_id)
-        return {
-            "content_type": "pdf",
-            "description": "",
-            "pdf_path": pdf_path,
-            "enrich_status": "pdf",
-            "status_reason": "",
-            "fetch_method": "http",
-        }
-
-    resp = _request(url)
-    pdf_link = _select_embedded_pdf_link(
-        resp.text, url, title=title, org_abbrev=org_abbrev
-    )
-
-    if org_abbrev.upper() in PREFER_EMBEDDED_PDF_ORGS and pdf_link:
-        pdf_path = download_pdf(pdf_link, org_abbrev, title, run_id)
-        return {
-            "content_type": "pdf",
-            "description": "",
-            "pdf_path": pdf_path,
-            "enrich_status": "pdf",
-            "status_reason": "embedded_pdf_preferred",
-            "fetch_method": "http",
-        }
-
-    description = extract_html_description(url, use_playwright=use_playwright)
-    if _is_short_or_placeholder(description) and pdf_link:
-        pdf_path = download_pdf(pdf_link, org_abbrev, title, run_id)
-        return {
-            "content_type": "pdf",
-            "description": "",
-            "pdf_path": pdf_path,
-            "enrich_status": "pdf",
-            "status_reason": "embedded_pdf",
-            "fetch_method": "http",
-        }
+    with _fetch_timeout(timeout):
+        if not url:
+            return {
+                "content_type": "error",
+                "description": "",
+                "pdf_path": "",
+                "enrich_status": "no_detail_url",
+                "status_reason": "missing_url",
+                "fetch_method": "none",
+            }
+
+        if _is_table_row_url(url):
+            pdf_path = _download_table_row_pdf(url, org_abbrev, title, run_id)
+            return {
+                "content_type": "pdf",
+                "description": "",
+                "pdf_path": pdf_path,
+                "enrich_status": "pdf",
+                "status_reason": "table_download_button",
+                "fetch_method": "playwright",
+            }
+
+        content_type = detect_content_type(url)
+
+        if content_type == "pdf":
+            pdf_path = download_pdf(url, org_abbrev, title, run_id)
+            return {
+                "content_type": "pdf",
+                "description": "",
+                "pdf_path": pdf_path,
+                "enrich_status": "pdf",
+                "status_reason": "",
+                "fetch_method": "http",
+            }
+
+        html = _fetch_html(url)
+        pdf_link = _select_embedded_pdf_link(
+            html, url, title=title, org_abbrev=org_abbrev
+        )
 
-    if _is_short_or_placeholder(description):
-        reason = (
-            "js_required"
-            if any(m in description.lower() for m in JS_PLACEHOLDER_MARKERS)
-            else "short_description"
+        if org_abbrev.upper() in PREFER_EMBEDDED_PDF_ORGS and pdf_link:
+            pdf_path = download_pdf(pdf_link, org_abbrev, title, run_id)
+            return {
+                "content_type": "pdf",
+                "description": "",
+                "pdf_path": pdf_path,
+                "enrich_status": "pdf",
+                "status_reason": "embedded_pdf_preferred",
+                "fetch_method": "http",
+            }
+
+        description = extract_html_description(
+            url, use_playwright=use_playwright, html=html
         )
-        status = "js_required" if reason == "js_required" else "short_content"
+        short = _is_short_or_placeholder(description)
+        if short and pdf_link:
+            pdf_path = download_pdf(pdf_link, org_abbrev, title, run_id)
+            return {
+                "content_type": "pdf",
+                "description": "",
+                "pdf_path": pdf_path,
+                "enrich_status": "pdf",
+                "status_reason": "embedded_pdf",
+                "fetch_method": "http",
+            }
+
+        if short:
+            reason = (
+                "js_required"
+                if _JS_PLACEHOLDER_RE.search(description)
+                else "short_description"
+            )
+            status = "js_required" if reason == "js_required" else "short_content"
+            return {
+                "content_type": "html",
+                "description": description,
+                "pdf_path": "",
+                "enrich_status": status,
+                "status_reason": reason,
+                "fetch_method": "http",
+            }
+
         return {
             "content_type": "html",
             "description": description,
             "pdf_path": "",
-            "enrich_status": status,
-            "status_reason": reason,
+            "enrich_status": "ok",
+            "status_reason": "",
             "fetch_method": "http",
         }
-
-    return {
-        "content_type": "html",
-        "description": description,
-        "pdf_path": "",
-        "enrich_status": "ok",
-        "status_reason": "",
-        "fetch_method": "http",
-    }
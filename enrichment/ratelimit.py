@@ -0,0 +1,107 @@
+"""Per-host request pacing and in-flight caps shared by concurrently running orgs."""
+
+import asyncio
+import threading
+import time
+from urllib.parse import urlparse
+
+from .config import MAX_FETCHES_PER_HOST, REQUEST_DELAY
+
+
+def _host(url: str) -> str:
+    return (urlparse(url).netloc or "").lower()
+
+
+class TokenBucket:
+    """Allow bursts of up to `capacity` requests, refilling at `rate_per_sec`.
+
+    Tokens may go negative: each caller reserves its slot under the lock and
+    then sleeps outside it, so concurrent callers queue in arrival order.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float):
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate_per_sec
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_sec
+
+    def acquire_sync(self) -> float:
+        """Block until a token is available; return seconds waited."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire(self) -> float:
+        """Async variant of acquire_sync."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class HostThrottle:
+    """Lazily keep one TokenBucket per host.
+
+    Steady state is one request per `min_interval` seconds per host, with up
+    to `burst` requests allowed back-to-back on a cold host. Different hosts
+    never wait on each other, so orgs running in parallel only slow down when
+    they share a host.
+    """
+
+    def __init__(self, min_interval: float = REQUEST_DELAY, burst: int = 3):
+        self.min_interval = min_interval
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str) -> TokenBucket:
+        """Return the bucket for url's host, creating it on first use."""
+        host = _host(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(1.0 / self.min_interval, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def wait(self, url: str) -> float:
+        """Block until a request to url's host may start; return seconds waited."""
+        if self.min_interval <= 0:
+            return 0.0
+        return self.bucket(url).acquire_sync()
+
+
+class HostSlots:
+    """Cap how many requests to one host are in flight at once.
+
+    HostThrottle spaces out request starts; this bounds the overlap when
+    responses are slow. One semaphore per host, created on first use.
+    """
+
+    def __init__(self, per_host: int = MAX_FETCHES_PER_HOST):
+        self.per_host = per_host
+        self._lock = threading.Lock()
+        self._slots: dict[str, threading.Semaphore] = {}
+
+    def slot(self, url: str) -> threading.Semaphore:
+        """Return url's host semaphore; use it as `with slots.slot(url): ...`."""
+        host = _host(url)
+        with self._lock:
+            slot = self._slots.get(host)
+            if slot is None:
+                slot = self._slots[host] = threading.Semaphore(self.per_host)
+            return slot
@@ -2,28 +2,49 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import importlib.util
+import itertools
 import json
-import signal
+import os
 import sys
 import time
 import uuid
-from contextlib import contextmanager
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable
 import threading
 
-from .config import PLAYWRIGHT_ORGS, REQUEST_DELAY, get_logs_path, get_profile_dir
-from .fetcher import classify_fetch_error, extract_html_description, fetch_job_content
+from scrapers_playwright.browser_pool import POOL as PLAYWRIGHT_POOL
+from . import jsonio
+from .config import (
+    MAX_FETCHES_PER_HOST,
+    MAX_PLAYWRIGHT_WORKERS,
+    PLAYWRIGHT_ORGS,
+    REQUEST_DELAY,
+    get_logs_path,
+    get_profile_dir,
+)
+from .detail_cache import DetailCache
+from .fetcher import (
+    classify_fetch_error,
+    extract_html_description,
+    fetch_job_content,
+    reset_sessions,
+)
+from .ratelimit import HostSlots, HostThrottle
 from .schema import (
     enrich_job,
-    is_enriched,
-    load_output,
+    load_enriched_by_url,
+    load_listing_cache,
     mark_enriched,
     mark_error,
+    save_listing_cache,
     save_output,
+    utc_now,
 )
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -31,37 +52,38 @@ SCRAPERS_DIR = PROJECT_ROOT / "scrapers"
 SCRAPERS_PW_DIR = PROJECT_ROOT / "scrapers_playwright"
 ORG_429_BREAKER_THRESHOLD = 3
 
+# Shared across orgs so parallel runs stay at one request per REQUEST_DELAY
+# against any single host, with a small burst allowance on a cold host.
+_HOST_THROTTLE = HostThrottle(REQUEST_DELAY, burst=3)
+# Caps overlapping fetches against one host when its responses are slow.
+_HOST_SLOTS = HostSlots(MAX_FETCHES_PER_HOST)
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+# Successful detail fetches, reused when the same posting shows up in
+# several orgs' listings during one process. Descriptions can run to tens of
+# thousands of characters, so the total cached text is capped as well.
+_DETAIL_CACHE = DetailCache(maxsize=2_000, max_chars=8_000_000)
 
 
-def _word_count(text: str) -> int:
-    return len((text or "").split())
+def _seconds_since(started_ns: int) -> float:
+    """Seconds elapsed since a perf_counter_ns() reading, truncated to ms."""
+    return (time.perf_counter_ns() - started_ns) // 1_000_000 / 1000
 
 
-@contextmanager
-def _time_limit(seconds: float):
-    """Hard timeout wrapper for single fetch calls (Unix only)."""
-    if (
-        seconds <= 0
-        or not hasattr(signal, "SIGALRM")
-        or threading.current_thread() is not threading.main_thread()
-    ):
-        yield
-        return
+def _word_count(text: str) -> int:
+    return len((text or "").split())
 
-    def _raise_timeout(_signum, _frame):
-        raise TimeoutError(f"fetch timed out after {seconds:.1f}s")
 
-    old_handler = signal.getsignal(signal.SIGALRM)
-    signal.signal(signal.SIGALRM, _raise_timeout)
-    signal.setitimer(signal.ITIMER_REAL, seconds)
-    try:
-        yield
-    finally:
-        signal.setitimer(signal.ITIMER_REAL, 0)
-        signal.signal(signal.SIGALRM, old_handler)
+# Events never dropped by RunnerConfig.sample_rate.
+ALWAYS_ON_EVENTS = frozenset(
+    {
+        "org_start",
+        "scraper_done",
+        "org_done",
+        "org_result",
+        "org_rate_limited",
+        "job_error",
+    }
+)
 
 
 @dataclass
@@ -73,46 +95,133 @@ class RunnerConfig:
     ndjson_path: Path | None = None
     profile: bool = False
     profile_dir: Path | None = None
+    # Sampling interval for pyinstrument; coarser than its 1 ms default so
+    # long org runs keep a small sample tree.
+    profile_interval: float = 0.005
+    ndjson_buffer_bytes: int = 64 * 1024
+    ndjson_flush_seconds: float = 1.0
+    # Keep 1 in sample_rate of the per-job events (job_start, job_result);
+    # events in always_on_events are always written.
+    sample_rate: int = 1
+    always_on_events: frozenset[str] = ALWAYS_ON_EVENTS
 
 
 class EventLogger:
+    """Structured run events to an NDJSON file and/or stdout.
+
+    File writes go through a queue drained by a background writer thread, so
+    emitting from many job threads never waits on disk I/O; the buffered
+    handle is flushed every ndjson_flush_seconds and on close.
+    """
+
     def __init__(self, cfg: RunnerConfig):
         self.cfg = cfg
+        # Fields shared by every event of the run.
+        self._run_fields = {"run_id": cfg.run_id, "batch_id": cfg.batch_id or ""}
         self._fh = None
-        self._lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._writer_error: Exception | None = None
+        self._pending: deque[bytes] = deque()
+        self._wake = threading.Event()
+        self._closing = False
+        self._print_lock = threading.Lock()
+        # One counter per event name, so interleaved event types do not shift
+        # each other's sampling. Factory and lookup are C-level, hence atomic.
+        self._sample_counters: defaultdict[str, itertools.count] = defaultdict(
+            functools.partial(itertools.count, 1)
+        )
         if cfg.ndjson_path:
             cfg.ndjson_path.parent.mkdir(parents=True, exist_ok=True)
-            self._fh = cfg.ndjson_path.open("a", encoding="utf-8")
+            self._fh = cfg.ndjson_path.open(
+                "ab", buffering=max(1, cfg.ndjson_buffer_bytes)
+            )
+            self._writer = threading.Thread(
+                target=self._drain, name="ndjson-writer", daemon=True
+            )
+            self._writer.start()
 
-    def close(self):
-        if self._fh:
-            self._fh.close()
-            self._fh = None
+    def _drain(self):
+        try:
+            last_flush = time.monotonic()
+            while True:
+                # The timeout keeps the periodic flush going when no new
+                # events arrive.
+                self._wake.wait(timeout=self.cfg.ndjson_flush_seconds)
+                self._wake.clear()
+                while self._pending:
+                    batch = []
+                    while self._pending and len(batch) < 256:
+                        batch.append(self._pending.popleft())
+                    self._fh.write(b"".join(batch))
+                now = time.monotonic()
+                if now - last_flush >= self.cfg.ndjson_flush_seconds:
+                    self._fh.flush()
+                    last_flush = now
+                if self._closing and not self._pending:
+                    return
+        except Exception as exc:  # noqa: BLE001 - re-raised from close()
+            self._writer_error = exc
 
-    def emit(self, event: str, **fields):
-        payload = {
-            "event": event,
-            "ts_utc": _utc_now(),
-            "run_id": self.cfg.run_id,
-            "batch_id": self.cfg.batch_id or "",
-            **fields,
-        }
+    def close(self):
+        if self._writer is not None:
+            self._closing = True
+            self._wake.set()
+            self._writer.join()
+            self._writer = None
         if self._fh:
-            with self._lock:
-                self._fh.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            try:
                 self._fh.flush()
+                os.fsync(self._fh.fileno())
+            finally:
+                self._fh.close()
+                self._fh = None
+        if self._writer_error is not None:
+            exc, self._writer_error = self._writer_error, None
+            raise exc
+
+    def _payload(self, event: str, fields: dict) -> dict:
+        return {"event": event, "ts_utc": utc_now(), **self._run_fields, **fields}
+
+    def _write(self, payloads: list[dict]):
+        if self.cfg.sample_rate > 1:
+            payloads = [p for p in payloads if self._keep(p["event"])]
+            if not payloads:
+                return
+        if self._writer is not None:
+            # deque.append is atomic; one entry per call keeps a batch's
+            # events contiguous in the file.
+            self._pending.append(b"".join(jsonio.dumps(p) + b"\n" for p in payloads))
+            self._wake.set()
         if self.cfg.live_events:
-            with self._lock:
-                print(json.dumps(payload, ensure_ascii=False), flush=True)
+            with self._print_lock:
+                for payload in payloads:
+                    print(json.dumps(payload, ensure_ascii=False), flush=True)
+
+    def _keep(self, event: str) -> bool:
+        if event in self.cfg.always_on_events:
+            return True
+        return next(self._sample_counters[event]) % self.cfg.sample_rate == 0
+
+    def emit(self, event: str, **fields):
+        self._write([self._payload(event, fields)])
+
+    def emit_many(self, events: list[dict]):
+        """Emit several events (each a dict with an "event" key) in one write."""
+        self._write(
+            [
+                self._payload(e["event"], {k: v for k, v in e.items() if k != "event"})
+                for e in events
+            ]
+        )
 
     def info(self, msg: str):
         if self.cfg.verbose:
-            with self._lock:
+            with self._print_lock:
                 print(msg, flush=True)
 
 
 def default_run_id(prefix: str = "run") -> str:
-    return f"{prefix}-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}-{uuid.uuid4().hex[:8]}"
+    return f"{prefix}-{time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())}-{uuid.uuid4().hex[:8]}"
 
 
 def default_ndjson_path(run_id: str) -> Path:
@@ -120,32 +229,64 @@ def default_ndjson_path(run_id: str) -> Path:
     return get_logs_path(run_id)
 
 
+# filepath -> (st_mtime_ns at import, module); an edited scraper is re-imported.
+_SCRAPER_MODULES: dict[Path, tuple[int, object]] = {}
+_SCRAPER_MODULES_LOCK = threading.Lock()
+
+
+def _scraper_path(scraper_file: str, is_playwright_scraper: bool) -> Path:
+    base_dir = SCRAPERS_PW_DIR if is_playwright_scraper else SCRAPERS_DIR
+    return base_dir / scraper_file
+
+
 def _load_scraper_module(filepath: Path):
-    parent = str(filepath.parent)
-    if parent not in sys.path:
-        sys.path.insert(0, parent)
-    spec = importlib.util.spec_from_file_location("scraper", filepath)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+    # Held for the whole import so a caller racing a background preload waits
+    # for it instead of executing the module a second time.
+    with _SCRAPER_MODULES_LOCK:
+        mtime_ns = filepath.stat().st_mtime_ns
+        cached = _SCRAPER_MODULES.get(filepath)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        parent = str(filepath.parent)
+        if parent not in sys.path:
+            sys.path.insert(0, parent)
+        spec = importlib.util.spec_from_file_location("scraper", filepath)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _SCRAPER_MODULES[filepath] = (mtime_ns, module)
+        return module
+
+
+def preload_scraper_module(scraper_file: str, is_playwright_scraper: bool = False):
+    """Import a scraper ahead of time so its org does not pay for it later.
+
+    Errors are swallowed here; they resurface when the org actually runs.
+    """
+    with contextlib.suppress(Exception):
+        _load_scraper_module(_scraper_path(scraper_file, is_playwright_scraper))
+
+
+@functools.lru_cache(maxsize=512)
+def _scraper_file_label(scraper_path: Path) -> str:
+    """Scraper path relative to the project root, as logged in events."""
+    return str(scraper_path.relative_to(PROJECT_ROOT))
 
 
 def run_scraper_for_org(
     scraper_path: Path, org_abbrev: str, org_name: str, logger: EventLogger
 ) -> list[dict]:
-    logger.info(
-        f"[{org_abbrev}] scraper_start file={scraper_path.relative_to(PROJECT_ROOT)}"
-    )
+    scraper_file = _scraper_file_label(scraper_path)
+    logger.info(f"[{org_abbrev}] scraper_start file={scraper_file}")
     logger.emit(
         "org_start",
         org_abbrev=org_abbrev,
         org_name=org_name,
-        scraper_file=str(scraper_path.relative_to(PROJECT_ROOT)),
+        scraper_file=scraper_file,
     )
-    started = time.perf_counter()
+    started = time.perf_counter_ns()
     mod = _load_scraper_module(scraper_path)
     jobs = mod.scrape()
-    elapsed = round(time.perf_counter() - started, 3)
+    elapsed = _seconds_since(started)
     logger.emit(
         "scraper_done",
         org_abbrev=org_abbrev,
@@ -157,7 +298,9 @@ def run_scraper_for_org(
     return jobs
 
 
-def _profile_call(enabled: bool, profile_out: Path | None, fn: Callable):
+def _profile_call(
+    enabled: bool, profile_out: Path | None, fn: Callable, interval: float = 0.005
+):
     if not enabled:
         return fn()
     if profile_out is None:
@@ -171,13 +314,13 @@ def _profile_call(enabled: bool, profile_out: Path | None, fn: Callable):
         ) from exc
 
     profile_out.parent.mkdir(parents=True, exist_ok=True)
-    profiler = Profiler()
+    profiler = Profiler(interval=interval)
     profiler.start()
     try:
         return fn()
     finally:
         profiler.stop()
-        profile_out.write_text(profiler.output_html())
+        profiler.write_html(profile_out)
 
 
 def _fetch_one(
@@ -232,17 +375,17 @@ def _fetch_one(
         )
         return result
 
-    started = time.perf_counter()
+    started = time.perf_counter_ns()
     try:
-        with _time_limit(job_timeout_seconds):
-            result = fetch_job_content(
-                url=url,
-                org_abbrev=org_abbrev,
-                title=title or f"job-{idx}",
-                use_playwright=is_playwright,
-                run_id=logger.cfg.run_id,
-            )
-        fetch_seconds = round(time.perf_counter() - started, 3)
+        result = fetch_job_content(
+            url=url,
+            org_abbrev=org_abbrev,
+            title=title or f"job-{idx}",
+            use_playwright=is_playwright,
+            run_id=logger.cfg.run_id,
+            timeout=job_timeout_seconds,
+        )
+        fetch_seconds = _seconds_since(started)
         out = {
             **result,
             "fetch_seconds": fetch_seconds,
@@ -270,16 +413,17 @@ def _fetch_one(
         )
         return out
     except Exception as exc:  # noqa: BLE001
-        fetch_seconds = round(time.perf_counter() - started, 3)
+        fetch_seconds = _seconds_since(started)
         status, reason = classify_fetch_error(exc)
 
         # Some Playwright-only pages fail in HTTP preflight; fallback to browser extraction.
         if is_playwright:
             try:
-                fallback_start = time.perf_counter()
-                with _time_limit(job_timeout_seconds):
-                    desc = extract_html_description(url, use_playwright=True)
-                fallback_seconds = round(time.perf_counter() - fallback_start, 3)
+                fallback_start = time.perf_counter_ns()
+                desc = extract_html_description(
+                    url, use_playwright=True, timeout=job_timeout_seconds
+                )
+                fallback_seconds = _seconds_since(fallback_start)
                 if len(desc) > 100:
                     out = {
                         "content_type": "html",
@@ -375,6 +519,96 @@ def _scraper_detail_result(raw_job: dict, org_abbrev: str) -> dict | None:
     }
 
 
+class _RateLimitBreaker:
+    """Per-org circuit breaker over consecutive http_429 fetch results.
+
+    Shared by an org's job workers, so counting and opening happen under a
+    lock; results that land after the breaker opened are ignored.
+    """
+
+    def __init__(self, threshold: int = ORG_429_BREAKER_THRESHOLD):
+        self.threshold = threshold
+        self.consecutive_429 = 0
+        self.is_open = False
+        self._lock = threading.Lock()
+
+    def record(self, fetch_res: dict) -> bool:
+        """Count one fetch result; return True if it just opened the breaker."""
+        rate_limited = (
+            fetch_res.get("enrich_status") == "blocked_source"
+            and fetch_res.get("status_reason") == "http_429"
+        )
+        with self._lock:
+            if self.is_open:
+                return False
+            if not rate_limited:
+                self.consecutive_429 = 0
+                return False
+            self.consecutive_429 += 1
+            self.is_open = self.consecutive_429 >= self.threshold
+            return self.is_open
+
+
+def _emit_breaker_open(
+    logger: EventLogger, org_abbrev: str, org_name: str, breaker: _RateLimitBreaker
+):
+    logger.emit(
+        "org_rate_limited",
+        org_abbrev=org_abbrev,
+        org_name=org_name,
+        consecutive_429=breaker.consecutive_429,
+        threshold=breaker.threshold,
+    )
+    logger.info(
+        f"[{org_abbrev}] rate_limit_breaker_open "
+        f"after {breaker.consecutive_429} consecutive http_429 errors"
+    )
+
+
+def _map_jobs(fn: Callable, jobs: list[dict], workers: int) -> list:
+    """Return [fn(i, job) for i, job in enumerate(jobs, 1)], in order.
+
+    With workers > 1 the calls run on a thread pool; detail fetches are
+    network-bound, and callers pace them per host with _HOST_THROTTLE and
+    cap their overlap per host with _HOST_SLOTS. Each worker closes its own
+    pooled Playwright browser and HTTP sessions when it runs out of jobs,
+    since only the owning thread can.
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        return [fn(i, job) for i, job in enumerate(jobs, start=1)]
+    results: list = [None] * len(jobs)
+    pending = iter(enumerate(jobs, start=1))
+    pending_lock = threading.Lock()
+
+    def _worker():
+        try:
+            while True:
+                with pending_lock:
+                    item = next(pending, None)
+                if item is None:
+                    return
+                i, job = item
+                results[i - 1] = fn(i, job)
+        finally:
+            PLAYWRIGHT_POOL.close()
+            reset_sessions()
+
+    n = min(workers, len(jobs))
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        for future in [pool.submit(_worker) for _ in range(n)]:
+            future.result()
+    return results
+
+
+def _job_workers(job_workers: int, playwright: bool) -> int:
+    """Worker count for an org's detail fetches.
+
+    Each thread doing Playwright fetches runs its own Chromium, so those
+    orgs get at most MAX_PLAYWRIGHT_WORKERS threads.
+    """
+    return min(job_workers, MAX_PLAYWRIGHT_WORKERS) if playwright else job_workers
+
+
 def enrich_org_via_runner(
     *,
     org_abbrev: str,
@@ -387,30 +621,45 @@ def enrich_org_via_runner(
     profile: bool = False,
     max_jobs: int | None = None,
     job_timeout_seconds: float = 30.0,
+    job_workers: int = 1,
 ) -> dict:
-    base_dir = SCRAPERS_PW_DIR if is_playwright_scraper else SCRAPERS_DIR
-    scraper_path = base_dir / scraper_file
+    scraper_path = _scraper_path(scraper_file, is_playwright_scraper)
 
     def _run():
-        raw_jobs = run_scraper_for_org(scraper_path, org_abbrev, org_name, logger)
-        existing = load_output(org_abbrev)
-        existing_by_url: dict[str, dict] = {}
-        if existing and not force:
-            for job in existing.get("jobs", []):
-                url = job.get("url", "")
-                if url and is_enriched(job):
-                    existing_by_url[url] = job
+        raw_jobs = None if force else load_listing_cache(org_abbrev, scraper_file)
+        if raw_jobs is None:
+            raw_jobs = run_scraper_for_org(scraper_path, org_abbrev, org_name, logger)
+            save_listing_cache(org_abbrev, scraper_file, raw_jobs)
+        else:
+            logger.emit_many(
+                [
+                    {
+                        "event": "org_start",
+                        "org_abbrev": org_abbrev,
+                        "org_name": org_name,
+                        "scraper_file": _scraper_file_label(scraper_path),
+                    },
+                    {
+                        "event": "scraper_done",
+                        "org_abbrev": org_abbrev,
+                        "org_name": org_name,
+                        "job_count": len(raw_jobs),
+                        "duration_seconds": 0.0,
+                        "cached": True,
+                    },
+                ]
+            )
+            logger.info(f"[{org_abbrev}] scraper_cached jobs={len(raw_jobs)}")
+        existing_by_url = {} if force else load_enriched_by_url(org_abbrev)
 
         pw_detail = use_playwright_detail or (org_abbrev in PLAYWRIGHT_ORGS)
-        enriched_jobs = []
         selected = raw_jobs[:max_jobs] if max_jobs and max_jobs > 0 else raw_jobs
-        consecutive_429 = 0
-        breaker_open = False
-        for i, raw_job in enumerate(selected, start=1):
+        breaker = _RateLimitBreaker()
+
+        def _enrich_one(i: int, raw_job: dict) -> dict:
             url = (raw_job.get("url") or "").strip()
-            if url in existing_by_url:
-                cached_job = existing_by_url[url]
-                enriched_jobs.append(cached_job)
+            if (cached_job := existing_by_url.get(url)) is not None:
+                words = _word_count(cached_job.get("description", ""))
                 logger.emit(
                     "job_result",
                     org_abbrev=org_abbrev,
@@ -421,17 +670,17 @@ def enrich_org_via_runner(
                     duration_seconds=0.0,
                     enrich_status=cached_job.get("enrich_status", "cached"),
                     content_type=cached_job.get("content_type", ""),
-                    word_count=_word_count(cached_job.get("description", "")),
+                    word_count=words,
                     status_reason="cached",
                     error="",
                 )
                 logger.info(
                     f"[{org_abbrev}] [{i}/{len(selected)}] DONE status=cached "
-                    f"words={_word_count(cached_job.get('description', ''))} t=0.000s"
+                    f"words={words} t=0.000s"
                 )
-                continue
+                return cached_job
 
-            if breaker_open:
+            if breaker.is_open:
                 fetch_res = _rate_limited_skip_result()
                 logger.emit(
                     "job_result",
@@ -474,39 +723,46 @@ def enrich_org_via_runner(
                         "status=ok type=html words="
                         f"{words} t=0.000s [scraper_detail]"
                     )
-                    consecutive_429 = 0
-                else:
-                    fetch_res = _fetch_one(
+                    breaker.record(fetch_res)
+                elif (shared := _DETAIL_CACHE.get(url)) is not None:
+                    fetch_res = {**shared, "fetch_seconds": 0.0}
+                    words = _word_count(fetch_res.get("description", ""))
+                    logger.emit(
+                        "job_result",
                         org_abbrev=org_abbrev,
                         org_name=org_name,
-                        idx=i,
-                        total=len(selected),
-                        title=(raw_job.get("title") or "").strip(),
-                        url=url,
-                        is_playwright=pw_detail,
-                        logger=logger,
-                        job_timeout_seconds=job_timeout_seconds,
+                        job_index=i,
+                        job_title=(raw_job.get("title") or "").strip(),
+                        job_url=url,
+                        duration_seconds=0.0,
+                        enrich_status=fetch_res.get("enrich_status", ""),
+                        content_type=fetch_res.get("content_type", ""),
+                        word_count=words,
+                        status_reason=fetch_res.get("status_reason", ""),
+                        error="",
+                    )
+                    logger.info(
+                        f"[{org_abbrev}] [{i}/{len(selected)}] DONE "
+                        f"status={fetch_res.get('enrich_status', '')} words={words} "
+                        "t=0.000s [detail_cache]"
                     )
-                    if (
-                        fetch_res.get("enrich_status") == "blocked_source"
-                        and fetch_res.get("status_reason") == "http_429"
-                    ):
-                        consecutive_429 += 1
-                        if consecutive_429 >= ORG_429_BREAKER_THRESHOLD:
-                            breaker_open = True
-                            logger.emit(
-                                "org_rate_limited",
-                                org_abbrev=org_abbrev,
-                                org_name=org_name,
-                                consecutive_429=consecutive_429,
-                                threshold=ORG_429_BREAKER_THRESHOLD,
-                            )
-                            logger.info(
-                                f"[{org_abbrev}] rate_limit_breaker_open "
-                                f"after {consecutive_429} consecutive http_429 errors"
-                            )
-                    else:
-                        consecutive_429 = 0
+                else:
+                    _HOST_THROTTLE.wait(url)
+                    with _HOST_SLOTS.slot(url):
+                        fetch_res = _fetch_one(
+                            org_abbrev=org_abbrev,
+                            org_name=org_name,
+                            idx=i,
+                            total=len(selected),
+                            title=(raw_job.get("title") or "").strip(),
+                            url=url,
+                            is_playwright=pw_detail,
+                            logger=logger,
+                            job_timeout_seconds=job_timeout_seconds,
+                        )
+                    _DETAIL_CACHE.put(url, fetch_res)
+                    if breaker.record(fetch_res):
+                        _emit_breaker_open(logger, org_abbrev, org_name, breaker)
 
             job = enrich_job(raw_job, org_name, org_abbrev)
             if fetch_res.get("error"):
@@ -528,10 +784,11 @@ def enrich_org_via_runner(
                     fetch_method=fetch_res.get("fetch_method", "http"),
                 )
             job["fetch_seconds"] = fetch_res.get("fetch_seconds", 0.0)
-            enriched_jobs.append(job)
+            return job
 
-            if i < len(selected):
-                time.sleep(REQUEST_DELAY)
+        enriched_jobs = _map_jobs(
+            _enrich_one, selected, _job_workers(job_workers, pw_detail)
+        )
 
         output_path = save_output(org_name, org_abbrev, enriched_jobs)
         logger.emit(
@@ -554,7 +811,13 @@ def enrich_org_via_runner(
     profile_out = (
         get_profile_dir(logger.cfg.run_id) / f"{org_abbrev}.html" if profile else None
     )
-    return _profile_call(profile, profile_out, _run)
+    try:
+        return _profile_call(profile, profile_out, _run, logger.cfg.profile_interval)
+    finally:
+        # Thread-local resources: the browser this thread may have launched
+        # and its HTTP sessions, so cookies do not carry over to the next org.
+        PLAYWRIGHT_POOL.close()
+        reset_sessions()
 
 
 def collect_postings_org_via_runner(
@@ -567,11 +830,12 @@ def collect_postings_org_via_runner(
     profile: bool = False,
     max_jobs: int | None = None,
     job_timeout_seconds: float = 30.0,
+    job_workers: int = 1,
 ) -> dict:
     org_block = {
         "org_abbrev": org_abbrev,
         "org_name": org_name,
-        "scraper_file": str(scraper_path.relative_to(PROJECT_ROOT)),
+        "scraper_file": _scraper_file_label(scraper_path),
         "is_playwright_scraper": is_playwright_scraper,
         "jobs": [],
         "scraper_error": "",
@@ -593,12 +857,12 @@ def collect_postings_org_via_runner(
             return org_block
 
         selected = jobs[:max_jobs] if max_jobs and max_jobs > 0 else jobs
-        consecutive_429 = 0
-        breaker_open = False
-        for idx, job in enumerate(selected, start=1):
+        breaker = _RateLimitBreaker()
+
+        def _collect_one(idx: int, job: dict) -> dict:
             title = (job.get("title") or "").strip()
             url = (job.get("url") or "").strip()
-            if breaker_open:
+            if breaker.is_open:
                 fetch_res = _rate_limited_skip_result()
                 logger.emit(
                     "job_result",
@@ -641,55 +905,64 @@ def collect_postings_org_via_runner(
                         "status=ok type=html words="
                         f"{words} t=0.000s [scraper_detail]"
                     )
-                    consecutive_429 = 0
-                else:
-                    fetch_res = _fetch_one(
+                    breaker.record(fetch_res)
+                elif (shared := _DETAIL_CACHE.get(url)) is not None:
+                    fetch_res = {**shared, "fetch_seconds": 0.0}
+                    words = _word_count(fetch_res.get("description", ""))
+                    logger.emit(
+                        "job_result",
                         org_abbrev=org_abbrev,
                         org_name=org_name,
-                        idx=idx,
-                        total=len(selected),
-                        title=title,
-                        url=url,
-                        is_playwright=is_playwright_scraper,
-                        logger=logger,
-                        job_timeout_seconds=job_timeout_seconds,
+                        job_index=idx,
+                        job_title=title,
+                        job_url=url,
+                        duration_seconds=0.0,
+                        enrich_status=fetch_res.get("enrich_status", ""),
+                        content_type=fetch_res.get("content_type", ""),
+                        word_count=words,
+                        status_reason=fetch_res.get("status_reason", ""),
+                        error="",
                     )
-                    if (
-                        fetch_res.get("enrich_status") == "blocked_source"
-                        and fetch_res.get("status_reason") == "http_429"
-                    ):
-                        consecutive_429 += 1
-                        if consecutive_429 >= ORG_429_BREAKER_THRESHOLD:
-                            breaker_open = True
-                            logger.emit(
-                                "org_rate_limited",
-                                org_abbrev=org_abbrev,
-                                org_name=org_name,
-                                consecutive_429=consecutive_429,
-                                threshold=ORG_429_BREAKER_THRESHOLD,
-                            )
-                            logger.info(
-                                f"[{org_abbrev}] rate_limit_breaker_open "
-                                f"after {consecutive_429} consecutive http_429 errors"
-                            )
-                    else:
-                        consecutive_429 = 0
-
-            org_block["jobs"].append(
-                {
-                    "index": idx,
-                    "title": title,
-                    "url": url,
-                    "content_type": fetch_res.get("content_type", ""),
-                    "enrich_status": fetch_res.get("enrich_status", ""),
-                    "status_reason": fetch_res.get("status_reason", ""),
-                    "fetch_method": fetch_res.get("fetch_method", ""),
-                    "description": fetch_res.get("description", ""),
-                    "pdf_path": fetch_res.get("pdf_path", ""),
-                    "fetch_seconds": fetch_res.get("fetch_seconds", 0.0),
-                    "error": fetch_res.get("error", ""),
-                }
-            )
+                    logger.info(
+                        f"[{org_abbrev}] [{idx}/{len(selected)}] DONE "
+                        f"status={fetch_res.get('enrich_status', '')} words={words} "
+                        "t=0.000s [detail_cache]"
+                    )
+                else:
+                    _HOST_THROTTLE.wait(url)
+                    with _HOST_SLOTS.slot(url):
+                        fetch_res = _fetch_one(
+                            org_abbrev=org_abbrev,
+                            org_name=org_name,
+                            idx=idx,
+                            total=len(selected),
+                            title=title,
+                            url=url,
+                            is_playwright=is_playwright_scraper,
+                            logger=logger,
+                            job_timeout_seconds=job_timeout_seconds,
+                        )
+                    _DETAIL_CACHE.put(url, fetch_res)
+                    if breaker.record(fetch_res):
+                        _emit_breaker_open(logger, org_abbrev, org_name, breaker)
+
+            return {
+                "index": idx,
+                "title": title,
+                "url": url,
+                "content_type": fetch_res.get("content_type", ""),
+                "enrich_status": fetch_res.get("enrich_status", ""),
+                "status_reason": fetch_res.get("status_reason", ""),
+                "fetch_method": fetch_res.get("fetch_method", ""),
+                "description": fetch_res.get("description", ""),
+                "pdf_path": fetch_res.get("pdf_path", ""),
+                "fetch_seconds": fetch_res.get("fetch_seconds", 0.0),
+                "error": fetch_res.get("error", ""),
+            }
+
+        org_block["jobs"] = _map_jobs(
+            _collect_one, selected, _job_workers(job_workers, is_playwright_scraper)
+        )
 
         logger.emit(
             "org_done",
@@ -703,4 +976,10 @@ def collect_postings_org_via_runner(
     profile_out = (
         get_profile_dir(logger.cfg.run_id) / f"{org_abbrev}.html" if profile else None
     )
-    return _profile_call(profile, profile_out, _run)
+    try:
+        return _profile_call(profile, profile_out, _run, logger.cfg.profile_interval)
+    finally:
+        # Thread-local resources: the browser this thread may have launched
+        # and its HTTP sessions, so cookies do not carry over to the next org.
+        PLAYWRIGHT_POOL.close()
+        reset_sessions()
@@ -1,36 +1,74 @@
 """Standardized job schema and helpers for enrichment output."""
 
-import json
+import functools
+import hashlib
+import os
 import re
-from datetime import datetime, timezone
+import time
+from datetime import date, datetime, timezone
 from pathlib import Path
+from types import MappingProxyType
 
-from .config import OUTPUT_DIR
+from . import jsonio
+from .config import LISTING_CACHE_MAX_AGE, OUTPUT_DIR
 
+_ABBREV_RE = re.compile(r"\[([^\]]+)\]")
 
+
+class _SecondTimestamp:
+    """UTC ISO-8601 timestamp at one-second resolution.
+
+    Formatted at most once per second; the cached (second, text) pair is
+    swapped in a single assignment, so concurrent callers need no lock.
+    """
+
+    def __init__(self):
+        self._last = (-1, "")
+
+    def __call__(self) -> str:
+        second = int(time.time())
+        last_second, text = self._last
+        if second != last_second:
+            text = datetime.fromtimestamp(second, timezone.utc).isoformat()
+            self._last = (second, text)
+        return text
+
+
+utc_now = _SecondTimestamp()
+
+
+@functools.lru_cache(maxsize=512)
 def extract_abbrev(org_name: str) -> str:
     """Extract abbreviation from org name like 'Full Name [ABBREV]'."""
-    match = re.search(r"\[([^\]]+)\]", org_name)
+    match = _ABBREV_RE.search(org_name)
     if match:
         return match.group(1)
     # Fallback: use first word uppercased
     return org_name.split()[0].upper()
 
 
+# Enrichment fields every job carries, filled in when the scraper left them out.
+_JOB_DEFAULTS = MappingProxyType(
+    {
+        "content_type": "",
+        "description": "",
+        "pdf_path": "",
+        "enriched_at": "",
+        "enrich_error": "",
+        "enrich_status": "",
+        "status_reason": "",
+        "fetch_method": "",
+    }
+)
+
+
 def enrich_job(job: dict, org_name: str, org_abbrev: str) -> dict:
-    """Add enrichment fields to a scraped job dict (in-place friendly)."""
-    enriched = {**job}
-    enriched["org_name"] = org_name
-    enriched["org_abbrev"] = org_abbrev
-    enriched.setdefault("content_type", "")
-    enriched.setdefault("description", "")
-    enriched.setdefault("pdf_path", "")
-    enriched.setdefault("enriched_at", "")
-    enriched.setdefault("enrich_error", "")
-    enriched.setdefault("enrich_status", "")
-    enriched.setdefault("status_reason", "")
-    enriched.setdefault("fetch_method", "")
-    return enriched
+    """Add enrichment fields to a scraped job dict in place and return it."""
+    job["org_name"] = org_name
+    job["org_abbrev"] = org_abbrev
+    for key, default in _JOB_DEFAULTS.items():
+        job.setdefault(key, default)
+    return job
 
 
 def mark_enriched(
@@ -49,7 +87,7 @@ def mark_enriched(
     job["enrich_status"] = enrich_status
     job["status_reason"] = status_reason
     job["fetch_method"] = fetch_method
-    job["enriched_at"] = datetime.now(timezone.utc).isoformat()
+    job["enriched_at"] = utc_now()
     job["enrich_error"] = ""
     return job
 
@@ -67,7 +105,7 @@ def mark_error(
     job["status_reason"] = status_reason
     job["fetch_method"] = fetch_method
     job["enrich_error"] = str(error_msg)
-    job["enriched_at"] = datetime.now(timezone.utc).isoformat()
+    job["enriched_at"] = utc_now()
     return job
 
 
@@ -84,8 +122,19 @@ def load_output(org_abbrev: str) -> dict | None:
     path = OUTPUT_DIR / f"{org_abbrev}.json"
     if not path.exists():
         return None
-    with open(path) as f:
-        return json.load(f)
+    return jsonio.loads(path.read_bytes())
+
+
+def load_enriched_by_url(org_abbrev: str) -> dict[str, dict]:
+    """Map detail URL -> job for the already-enriched jobs in an org's output."""
+    existing = load_output(org_abbrev)
+    if not existing:
+        return {}
+    return {
+        url: job
+        for job in existing.get("jobs", [])
+        if (url := job.get("url", "")) and is_enriched(job)
+    }
 
 
 def save_output(org_name: str, org_abbrev: str, jobs: list[dict]) -> Path:
@@ -99,6 +148,40 @@ def save_output(org_name: str, org_abbrev: str, jobs: list[dict]) -> Path:
         "job_count": len(jobs),
         "jobs": jobs,
     }
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    path.write_bytes(jsonio.dumps(data, indent=True))
+    return path
+
+
+def listing_cache_path(org_abbrev: str, scraper_file: str) -> Path:
+    """Path of today's cached scraper listing for an org."""
+    key = hashlib.sha1(f"{scraper_file}{date.today().isoformat()}".encode()).hexdigest()
+    return OUTPUT_DIR / f"{org_abbrev}.listing.{key}.json"
+
+
+def load_listing_cache(
+    org_abbrev: str, scraper_file: str, max_age: float = LISTING_CACHE_MAX_AGE
+) -> list[dict] | None:
+    """Load a cached scraper listing, or None if missing or older than max_age."""
+    path = listing_cache_path(org_abbrev, scraper_file)
+    try:
+        if time.time() - path.stat().st_mtime > max_age:
+            return None
+        return jsonio.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def save_listing_cache(org_abbrev: str, scraper_file: str, jobs: list[dict]) -> Path:
+    """Atomically write a scraper listing to the cache. Returns the cache path.
+
+    Listings cached for the org under an earlier day or scraper are removed.
+    """
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    path = listing_cache_path(org_abbrev, scraper_file)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(jsonio.dumps(jobs))
+    os.replace(tmp, path)
+    for stale in OUTPUT_DIR.glob(f"{org_abbrev}.listing.*.json"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
     return path
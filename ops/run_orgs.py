@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import argparse
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import json
 import os
 import subprocess
 import sys
@@ -17,20 +16,19 @@ sys.path.insert(0, str(PROJECT_ROOT))
 sys.path.insert(0, str(PROJECT_ROOT / "scrapers"))
 sys.path.insert(0, str(PROJECT_ROOT / "scrapers_playwright"))
 
-from enrichment.runner import (  # noqa: E402
-    EventLogger,
-    RunnerConfig,
-    collect_postings_org_via_runner,
-    default_ndjson_path,
-    default_run_id,
-)
+from enrichment import jsonio  # noqa: E402
 from enrichment.schema import extract_abbrev  # noqa: E402
-from scraper_registry import SCRAPER_INFO, SCRAPER_INFO_PW, find_scraper_by_abbrev  # noqa: E402
+
+# The runner (fetcher, parsers, Playwright) and the scraper registry are
+# imported where they are used, so `--help` and argument errors return
+# without loading the scraping stack.
 
 RUNS_DIR = PROJECT_ROOT / "ops" / "runs"
 
 
 def _find_scraper_for_org(org_abbrev: str) -> tuple[Path, str, bool]:
+    from scraper_registry import SCRAPER_INFO, SCRAPER_INFO_PW
+
     for filename, (org_name, _url) in SCRAPER_INFO.items():
         if extract_abbrev(org_name).upper() == org_abbrev.upper():
             return PROJECT_ROOT / "scrapers" / filename, org_name, False
@@ -42,6 +40,8 @@ def _find_scraper_for_org(org_abbrev: str) -> tuple[Path, str, bool]:
 
 def _resolve_orgs(args) -> list[str]:
     """Resolve org list from --all or --org flags."""
+    from scraper_registry import SCRAPER_INFO, SCRAPER_INFO_PW, find_scraper_by_abbrev
+
     if args.all:
         all_abbrevs = []
         for _filename, (org_name, _url) in SCRAPER_INFO.items():
@@ -72,7 +72,16 @@ def _collect_postings_payload(
     max_jobs_per_org: int | None = None,
     job_timeout_seconds: float = 30.0,
     parallel_orgs: int = 1,
+    job_workers: int = 1,
 ) -> dict:
+    from enrichment.runner import (
+        EventLogger,
+        RunnerConfig,
+        collect_postings_org_via_runner,
+        default_ndjson_path,
+        default_run_id,
+    )
+
     ts = datetime.now(timezone.utc).isoformat()
     local_run_id = run_id or default_run_id("run")
     ndjson_path = log_ndjson or default_ndjson_path(local_run_id)
@@ -108,6 +117,7 @@ def _collect_postings_payload(
                     profile=profile,
                     max_jobs=max_jobs_per_org,
                     job_timeout_seconds=job_timeout_seconds,
+                    job_workers=job_workers,
                 )
                 payload["orgs"].append(org_block)
                 _persist_org_block(org_block)
@@ -128,15 +138,24 @@ def _collect_postings_payload(
                     profile=profile,
                     max_jobs=max_jobs_per_org,
                     job_timeout_seconds=job_timeout_seconds,
+                    job_workers=job_workers,
                 )
                 return i, org_block
 
             with ThreadPoolExecutor(max_workers=parallel_orgs) as pool:
                 futures = [pool.submit(_run_one, pair) for pair in indexed]
-                for fut in as_completed(futures):
+                for done, fut in enumerate(as_completed(futures), start=1):
                     i, org_block = fut.result()
                     out_by_index[i] = org_block
                     _persist_org_block(org_block)
+                    status = (
+                        f"scraper_error: {org_block['scraper_error']}"
+                        if org_block["scraper_error"]
+                        else f"{len(org_block['jobs'])} jobs"
+                    )
+                    print(
+                        f"  [{done}/{len(orgs)}] {org_block['org_abbrev']} done ({status})"
+                    )
 
             for i in range(len(orgs)):
                 payload["orgs"].append(out_by_index[i])
@@ -214,7 +233,7 @@ def _write_report(
         "test_exit_code": test_exit_code,
         "results": results,
     }
-    json_path.write_text(json.dumps(payload, indent=2))
+    json_path.write_bytes(jsonio.dumps(payload, indent=True))
 
     lines = [
         "# Run Report",
@@ -258,7 +277,7 @@ def _write_org_postings_json(run_id: str, org_block: dict) -> Path:
     postings_dir.mkdir(parents=True, exist_ok=True)
     org_abbrev = (org_block.get("org_abbrev") or "UNKNOWN").upper()
     path = postings_dir / f"{org_abbrev}.json"
-    path.write_text(json.dumps(org_block, indent=2))
+    path.write_bytes(jsonio.dumps(org_block, indent=True))
     return path
 
 
@@ -309,7 +328,7 @@ def main() -> int:
         "--job-timeout-seconds",
         type=float,
         default=30.0,
-        help="Hard timeout per job detail fetch call.",
+        help="Timeout for each HTTP read and browser wait of a job detail fetch.",
     )
     parser.add_argument(
         "--parallel-orgs",
@@ -317,6 +336,15 @@ def main() -> int:
         default=1,
         help="Number of organizations to process in parallel.",
     )
+    parser.add_argument(
+        "--job-workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of job detail fetches to run in parallel within each org; "
+            "fetches stay paced per host across all orgs."
+        ),
+    )
     parser.add_argument(
         "--skip-tests",
         action="store_true",
@@ -339,6 +367,7 @@ def main() -> int:
         max_jobs_per_org=args.max_jobs_per_org,
         job_timeout_seconds=args.job_timeout_seconds,
         parallel_orgs=max(1, args.parallel_orgs),
+        job_workers=max(1, args.job_workers),
     )
 
     run_id = postings_payload["run_id"]
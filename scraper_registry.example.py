@@ -4,6 +4,20 @@ Copy this file to scraper_registry.py and add your own scrapers.
 Each entry maps scraper filename -> (org_full_name, listing_url).
 """
 
+import re
+from typing import NamedTuple
+
+_ABBREV_RE = re.compile(r"\[([^\]]+)\]")
+
+
+class ScraperEntry(NamedTuple):
+    """Registry entry; still unpacks and indexes like the plain tuples."""
+
+    org_name: str
+    url: str
+    is_playwright: bool = False
+
+
 # Standard (requests/BeautifulSoup) scrapers
 SCRAPER_INFO = {
     "scrape_example.py": (
@@ -21,13 +35,13 @@ SCRAPER_INFO_PW = {
 }
 
 
-def get_all_scrapers() -> dict:
+def get_all_scrapers() -> dict[str, ScraperEntry]:
     """Return combined registry with playwright flag as third tuple element."""
     combined = {}
     for filename, (name, url) in SCRAPER_INFO.items():
-        combined[filename] = (name, url, False)
+        combined[filename] = ScraperEntry(name, url, False)
     for filename, (name, url) in SCRAPER_INFO_PW.items():
-        combined[filename] = (name, url, True)
+        combined[filename] = ScraperEntry(name, url, True)
     return combined
 
 
@@ -36,17 +50,15 @@ def find_scraper_by_abbrev(abbrev: str) -> tuple[str, str, str, bool] | None:
 
     Returns (filename, org_name, url, is_playwright) or None.
     """
-    import re
-
     abbrev_upper = abbrev.upper()
 
     for filename, (name, url) in SCRAPER_INFO.items():
-        match = re.search(r"\[([^\]]+)\]", name)
+        match = _ABBREV_RE.search(name)
         if match and match.group(1).upper() == abbrev_upper:
             return filename, name, url, False
 
     for filename, (name, url) in SCRAPER_INFO_PW.items():
-        match = re.search(r"\[([^\]]+)\]", name)
+        match = _ABBREV_RE.search(name)
         if match and match.group(1).upper() == abbrev_upper:
             return filename, name, url, True
 
@@ -1,12 +1,50 @@
 """Shared utilities for all scrapers."""
 
+import threading
 import time
 from email.utils import parsedate_to_datetime
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
 
 from config import DEFAULT_HEADERS, API_JSON_HEADERS, API_EXTENDED_HEADERS
 
+# HTTP session policy for the project (enrichment/fetcher.py follows it for
+# its direct GETs): one pooled session per thread, so repeated requests to the
+# same host reuse keep-alive connections instead of a new TCP + TLS handshake
+# each. Sessions are not shared across threads: requests.Session is not
+# thread-safe, and a shared cookie jar would carry one org's cookies into
+# another org's requests. The runner closes a thread's sessions when its org
+# or job worker finishes. One thread drives one request at a time, so the
+# default-sized connection pool is enough.
+_LOCAL = threading.local()
+
+
+def _session() -> requests.Session:
+    """Return this thread's session, creating it on first use."""
+    session = getattr(_LOCAL, "session", None)
+    if session is None:
+        session = requests.Session()
+        # fetch() does its own retries.
+        adapter = HTTPAdapter(pool_connections=20)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _LOCAL.session = session
+    return session
+
+
+def reset_session():
+    """Close this thread's session so the next org starts without its cookies."""
+    session = getattr(_LOCAL, "session", None)
+    _LOCAL.session = None
+    if session is not None:
+        session.close()
+
 
 def _retry_delay_seconds(exc: requests.RequestException, attempt: int) -> float:
     """Compute retry delay, honoring Retry-After for 429 responses."""
@@ -35,7 +73,7 @@ def fetch(url, method="GET", headers=None, **kwargs):
         headers = DEFAULT_HEADERS
     for attempt in range(3):
         try:
-            resp = requests.request(method, url, headers=headers, **kwargs)
+            resp = _session().request(method, url, headers=headers, **kwargs)
             resp.raise_for_status()
             return resp
         except requests.RequestException as exc:
@@ -44,6 +82,13 @@ def fetch(url, method="GET", headers=None, **kwargs):
             time.sleep(_retry_delay_seconds(exc, attempt))
 
 
+def json_body(resp):
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
 def normalize_url(href, base_url):
     """Return absolute URL: if href starts with http, return as-is, else prepend base_url."""
     if href.startswith("http"):
@@ -101,7 +146,7 @@ def scrape_api_json_paginated(base_url, api_url):
         }
         resp = fetch(api_url, method="POST", headers=API_JSON_HEADERS, json=payload)
         try:
-            data = resp.json()
+            data = json_body(resp)
         except Exception:
             # Some tenants occasionally return HTML maintenance pages.
             # Treat this as no postings instead of crashing the whole batch.
@@ -197,7 +242,7 @@ def scrape_api_advanced_paginated(
             cookies=cookies,
             params={"lang": "en", "portal": portal_id},
         )
-        data = resp.json()
+        data = json_body(resp)
 
         jobs = data.get("requisitionList", [])
         if not jobs:
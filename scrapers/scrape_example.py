@@ -5,7 +5,13 @@ Replace example.com with your target website and adapt the selectors/patterns.
 """
 
 from bs4 import BeautifulSoup
-from base import fetch, extract_links, scrape_api_json_paginated, DEFAULT_HEADERS
+from base import (
+    fetch,
+    extract_links,
+    json_body,
+    scrape_api_json_paginated,
+    DEFAULT_HEADERS,
+)
 
 
 # Example 1: Simple HTML scraping with link extraction
@@ -38,7 +44,7 @@ def scrape_api_example():
     while True:
         url = f"https://api.example.com/v1/jobs?page={page}&per_page={per_page}"
         resp = fetch(url, headers=DEFAULT_HEADERS)
-        data = resp.json()
+        data = json_body(resp)
 
         # Adjust based on your API's response structure
         postings = data.get("results", [])
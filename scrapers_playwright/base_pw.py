@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
+import re
 from typing import Callable
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-from playwright.sync_api import sync_playwright
 
 from config import USER_AGENT, BLOCK_MARKERS
+from scrapers_playwright.browser_pool import POOL as PLAYWRIGHT_POOL
+from scrapers_playwright.browser_pool import PlaywrightPool
 
 Extractor = Callable[..., list[dict]]
 
+# The headless browser is launched once per thread and reused across scrapes
+# and detail enrichment; each scrape gets a new context. The headful one is
+# only for the fallback and is closed right after each use.
+_HEADFUL_POOL = PlaywrightPool(headless=False)
+
+# One alternation scans the page once instead of once per marker.
+_BLOCK_MARKER_RE = (
+    re.compile("|".join(re.escape(m.lower()) for m in BLOCK_MARKERS))
+    if BLOCK_MARKERS
+    else None
+)
+
 
 def normalize_url(href: str, base_url: str) -> str:
     """Return an absolute URL from href + base URL."""
@@ -20,10 +34,11 @@ def normalize_url(href: str, base_url: str) -> str:
 
 
 def _looks_blocked(html: str, status_code: int | None) -> bool:
-    lowered = html.lower()
     if status_code in {401, 403, 429, 503}:
         return True
-    return any(marker in lowered for marker in BLOCK_MARKERS)
+    if _BLOCK_MARKER_RE is None:
+        return False
+    return _BLOCK_MARKER_RE.search(html.lower()) is not None
 
 
 def _normalize_whitespace(text: str) -> str:
@@ -82,13 +97,12 @@ def run_scraper(
 
     for headless in modes:
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=headless)
-                context = browser.new_context(
-                    user_agent=USER_AGENT,
-                    ignore_https_errors=True,
-                    java_script_enabled=True,
-                )
+            pool = PLAYWRIGHT_POOL if headless else _HEADFUL_POOL
+            with pool.context(
+                user_agent=USER_AGENT,
+                ignore_https_errors=True,
+                java_script_enabled=True,
+            ) as context:
                 page = context.new_page()
                 response = page.goto(
                     url, wait_until="domcontentloaded", timeout=timeout_ms
@@ -108,9 +122,6 @@ def run_scraper(
                 blocked = _looks_blocked(page.content(), status_code)
                 jobs = extractor(page=page, context=context)
 
-                context.close()
-                browser.close()
-
                 # Some sites intermittently block automation traffic; treat this as
                 # an empty scrape result instead of a hard failure.
                 if blocked and not jobs:
@@ -120,6 +131,9 @@ def run_scraper(
         except Exception as exc:  # noqa: PERF203
             last_err = exc
             continue
+        finally:
+            if not headless:
+                _HEADFUL_POOL.close()
 
     if last_err:
         raise last_err
@@ -0,0 +1,75 @@
+"""Reusable headless Chromium for Playwright scrapes and detail extraction.
+
+Sync Playwright objects are bound to the thread that created them, so each
+thread gets its own browser. It is launched on first use and reused across
+calls with a fresh context per page. Only the owning thread can close it:
+call close() from that thread once its Playwright work is done.
+"""
+
+import atexit
+import threading
+from contextlib import contextmanager
+
+
+def _playwright_error() -> type[Exception]:
+    from playwright.sync_api import Error
+
+    return Error
+
+
+class PlaywrightPool:
+    def __init__(self, headless: bool = True):
+        self.headless = headless
+        self._local = threading.local()
+
+    def _start_playwright(self):
+        from playwright.sync_api import sync_playwright
+
+        return sync_playwright().start()
+
+    def _browser(self):
+        browser = getattr(self._local, "browser", None)
+        if browser is not None and browser.is_connected():
+            return browser
+
+        pw = getattr(self._local, "pw", None)
+        if pw is None:
+            pw = self._start_playwright()
+            self._local.pw = pw
+        browser = pw.chromium.launch(headless=self.headless)
+        self._local.browser = browser
+        return browser
+
+    @contextmanager
+    def context(self, **ctx_kwargs):
+        """Yield a fresh browser context on this thread's browser."""
+        ctx = self._browser().new_context(**ctx_kwargs)
+        try:
+            yield ctx
+        finally:
+            try:
+                ctx.close()
+            except _playwright_error():
+                # The browser went away mid-use; _browser() relaunches it.
+                pass
+
+    def close(self):
+        """Stop the calling thread's browser and Playwright driver, if any."""
+        browser = getattr(self._local, "browser", None)
+        pw = getattr(self._local, "pw", None)
+        self._local.browser = None
+        self._local.pw = None
+        if browser is not None:
+            try:
+                browser.close()
+            except _playwright_error():
+                # Already disconnected; stopping the driver below still runs.
+                pass
+        if pw is not None:
+            pw.stop()
+
+
+POOL = PlaywrightPool()
+# atexit runs on the main thread, so this only reaches the main thread's
+# browser; worker threads close their own when their work is done.
+atexit.register(POOL.close)
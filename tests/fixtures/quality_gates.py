@@ -8,13 +8,18 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_QUALITY_GATES_PATH = PROJECT_ROOT / "tests" / "fixtures" / "quality_gates.yaml"
 SUCCESS_STATUSES = {"ok", "short_content"}
 
 
 def load_quality_gates(path: Path = DEFAULT_QUALITY_GATES_PATH) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text()) or {}
+    data = yaml.load(path.read_text(), Loader=SafeLoader) or {}
     defaults = data.get("defaults") or {}
     return {
         "defaults": defaults,
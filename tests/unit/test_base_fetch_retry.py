@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 import requests
 
@@ -28,7 +30,7 @@ def test_fetch_uses_retry_after_for_429(monkeypatch):
             return _FakeResp(429, {"Retry-After": "3"})
         return _FakeResp(200)
 
-    monkeypatch.setattr(base.requests, "request", fake_request)
+    monkeypatch.setattr(base._session(), "request", fake_request)
     monkeypatch.setattr(base.time, "sleep", lambda s: sleeps.append(s))
 
     out = base.fetch(GENERIC_URLS["example"])
@@ -48,7 +50,7 @@ def test_fetch_uses_exponential_backoff_without_retry_after(monkeypatch):
             return _FakeResp(429)
         return _FakeResp(200)
 
-    monkeypatch.setattr(base.requests, "request", fake_request)
+    monkeypatch.setattr(base._session(), "request", fake_request)
     monkeypatch.setattr(base.time, "sleep", lambda s: sleeps.append(s))
 
     out = base.fetch(GENERIC_URLS["example"])
@@ -68,10 +70,28 @@ def test_fetch_retries_non_429_errors_with_default_backoff(monkeypatch):
             return _FakeResp(500)
         return _FakeResp(200)
 
-    monkeypatch.setattr(base.requests, "request", fake_request)
+    monkeypatch.setattr(base._session(), "request", fake_request)
     monkeypatch.setattr(base.time, "sleep", lambda s: sleeps.append(s))
 
     out = base.fetch(GENERIC_URLS["example"])
     assert out.status_code == 200
     assert calls["n"] == 3
     assert sleeps == [1.0, 2.0]
+
+
+@pytest.mark.unit
+def test_sessions_are_per_thread_and_reset_per_org():
+    main = base._session()
+    assert base._session() is main
+
+    other = []
+    worker = threading.Thread(target=lambda: other.append(base._session()))
+    worker.start()
+    worker.join()
+    assert other[0] is not main
+
+    main.cookies.set("org", "A")
+    base.reset_session()
+    fresh = base._session()
+    assert fresh is not main
+    assert not fresh.cookies
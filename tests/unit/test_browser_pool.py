@@ -0,0 +1,76 @@
+import threading
+
+import pytest
+
+from scrapers_playwright.browser_pool import PlaywrightPool
+
+
+class _FakeBrowser:
+    def __init__(self, log):
+        self.log = log
+        self.owner = threading.get_ident()
+
+    def is_connected(self):
+        return True
+
+    def new_context(self, **kwargs):
+        return _FakeContext()
+
+    def close(self):
+        self.log.append(("browser", self.owner, threading.get_ident()))
+
+
+class _FakeContext:
+    def close(self):
+        pass
+
+
+class _FakePlaywright:
+    def __init__(self, log):
+        self.log = log
+        self.owner = threading.get_ident()
+        self.chromium = self
+
+    def launch(self, headless):
+        return _FakeBrowser(self.log)
+
+    def stop(self):
+        self.log.append(("driver", self.owner, threading.get_ident()))
+
+
+class _FakePool(PlaywrightPool):
+    def __init__(self):
+        super().__init__()
+        self.log = []
+
+    def _start_playwright(self):
+        return _FakePlaywright(self.log)
+
+
+@pytest.mark.unit
+def test_pool_closes_browsers_on_their_owning_thread():
+    pool = _FakePool()
+
+    def _use_and_close():
+        with pool.context():
+            pass
+        pool.close()
+
+    worker = threading.Thread(target=_use_and_close)
+    with pool.context():
+        pass
+    worker.start()
+    worker.join()
+
+    # The worker closed its own browser and left the main thread's alone.
+    assert [(kind, owner == closer) for kind, owner, closer in pool.log] == [
+        ("browser", True),
+        ("driver", True),
+    ]
+    assert all(owner == worker.ident for _kind, owner, _closer in pool.log)
+
+    pool.close()
+    main = threading.get_ident()
+    assert pool.log[2:] == [("browser", main, main), ("driver", main, main)]
+    pool.close()
+    assert len(pool.log) == 4
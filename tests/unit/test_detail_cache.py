@@ -0,0 +1,54 @@
+import pytest
+
+from enrichment.detail_cache import DetailCache, normalize_url
+from tests.test_config import GENERIC_URLS
+
+
+def _ok(description="text"):
+    return {"enrich_status": "ok", "content_type": "html", "description": description}
+
+
+@pytest.mark.unit
+def test_normalize_url_sorts_query_and_keeps_row_fragment():
+    base = GENERIC_URLS["example"]
+    assert normalize_url(f"{base}/job?b=2&a=1") == normalize_url(f"{base}/job?a=1&b=2")
+    assert normalize_url(f"{base}/t#row-1") != normalize_url(f"{base}/t#row-2")
+
+
+@pytest.mark.unit
+def test_detail_cache_only_keeps_successes():
+    cache = DetailCache()
+    url = f"{GENERIC_URLS['example']}/job/1"
+
+    assert not cache.put(url, {"enrich_status": "blocked_source", "error": "429"})
+    assert cache.get(url) is None
+    assert cache.put(url, _ok())
+    assert cache.get(url)["description"] == "text"
+
+
+@pytest.mark.unit
+def test_detail_cache_evicts_least_recently_used():
+    cache = DetailCache(maxsize=2)
+    base = GENERIC_URLS["example"]
+    cache.put(f"{base}/1", _ok())
+    cache.put(f"{base}/2", _ok())
+    cache.get(f"{base}/1")
+    cache.put(f"{base}/3", _ok())
+
+    assert cache.get(f"{base}/2") is None
+    assert cache.get(f"{base}/1") is not None
+    assert len(cache) == 2
+
+
+@pytest.mark.unit
+def test_detail_cache_caps_total_description_chars():
+    cache = DetailCache(maxsize=10, max_chars=10)
+    base = GENERIC_URLS["example"]
+    cache.put(f"{base}/1", _ok("a" * 4))
+    cache.put(f"{base}/2", _ok("b" * 4))
+    cache.put(f"{base}/3", _ok("c" * 4))
+
+    assert cache.get(f"{base}/1") is None
+    assert cache.get(f"{base}/2") is not None
+    assert not cache.put(f"{base}/4", _ok("d" * 11))
+    assert len(cache) == 2
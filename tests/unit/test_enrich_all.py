@@ -0,0 +1,84 @@
+import json
+import time
+
+import pytest
+
+from enrichment import enrich
+
+
+def _registry():
+    return {
+        "scrape_a.py": ("Org A [ORGA]", "https://a.example.org", False),
+        "scrape_b.py": ("Org B [ORGB]", "https://b.example.org", False),
+        "scrape_c.py": ("Org C [ORGC]", "https://c.example.org", True),
+    }
+
+
+@pytest.mark.unit
+def test_enrich_all_parallel_keeps_registry_order(monkeypatch, tmp_path, capsys):
+    def fake_runner(**kwargs):
+        # Finish in reverse order to make sure results are not completion-ordered.
+        time.sleep({"ORGA": 0.06, "ORGB": 0.03, "ORGC": 0.0}[kwargs["org_abbrev"]])
+        if kwargs["org_abbrev"] == "ORGB":
+            raise RuntimeError("boom")
+        return {"org_abbrev": kwargs["org_abbrev"], "job_count": 1}
+
+    monkeypatch.setattr(enrich, "enrich_org_via_runner", fake_runner)
+    log_path = tmp_path / "run.ndjson"
+    results = enrich.enrich_all(
+        _registry(),
+        verbose=False,
+        log_ndjson=log_path,
+        parallel_orgs=3,
+    )
+
+    assert [r["org_abbrev"] for r in results] == ["ORGA", "ORGB", "ORGC"]
+    assert results[1]["error"] == "boom"
+    assert "error" not in results[0]
+
+    events = [json.loads(line) for line in log_path.read_text().splitlines()]
+    org_results = [e for e in events if e["event"] == "org_result"]
+    assert sorted(e["org_abbrev"] for e in org_results) == ["ORGA", "ORGB", "ORGC"]
+
+    progress = [line for line in capsys.readouterr().out.splitlines() if "/3]" in line]
+    assert len(progress) == 3
+    assert progress[0].strip().startswith("[1/3] ORGC done")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("parallel_orgs", "expected"),
+    [
+        (1, ["scrape_b.py", "scrape_c.py", "scrape_d.py"]),
+        (2, ["scrape_c.py", "scrape_d.py"]),
+    ],
+)
+def test_enrich_all_preloads_first_org_not_yet_started(
+    monkeypatch, tmp_path, parallel_orgs, expected
+):
+    registry = {
+        **_registry(),
+        "scrape_d.py": ("Org D [ORGD]", "https://d.example.org", False),
+    }
+    preloaded = []
+    monkeypatch.setattr(
+        enrich,
+        "preload_scraper_module",
+        lambda scraper_file, is_pw: preloaded.append(scraper_file),
+    )
+
+    def fake_runner(**kwargs):
+        # Stay busy long enough for the queued preload to run.
+        time.sleep(0.02)
+        return {"org_abbrev": kwargs["org_abbrev"], "job_count": 0}
+
+    monkeypatch.setattr(enrich, "enrich_org_via_runner", fake_runner)
+
+    enrich.enrich_all(
+        registry,
+        verbose=False,
+        log_ndjson=tmp_path / "run.ndjson",
+        parallel_orgs=parallel_orgs,
+    )
+
+    assert sorted(preloaded) == expected
@@ -1,6 +1,14 @@
+import sys
+import threading
+from urllib.parse import urljoin
+
 import pytest
+import requests
+from bs4 import BeautifulSoup
 
+from enrichment import fetcher
 from enrichment.fetcher import (
+    _fetch_html,
     _find_embedded_pdf_link,
     _is_short_or_placeholder,
     classify_fetch_error,
@@ -47,3 +55,325 @@ def test_find_embedded_pdf_link_none():
 def test_is_short_or_placeholder_flags_low_word_count_even_if_long_chars():
     text = ("alpha " * 21).strip()  # >120 chars but only 21 words
     assert _is_short_or_placeholder(text)
+
+
+@pytest.mark.unit
+def test_fetch_html_stops_reading_at_byte_cap(monkeypatch):
+    class _StreamResp:
+        encoding = "utf-8"
+        pulled = 0
+        closed = False
+
+        def iter_content(self, chunk_size):
+            while True:
+                self.pulled += 1
+                yield b"<p>" + b"x" * (chunk_size - 3)
+
+        def close(self):
+            self.closed = True
+
+    resp = _StreamResp()
+    monkeypatch.setattr(fetcher, "_request", lambda url, **kwargs: resp)
+
+    html = _fetch_html(GENERIC_URLS["example"], max_bytes=100_000)
+
+    assert len(html) == 100_000
+    assert resp.pulled == 2
+    assert resp.closed
+
+
+@pytest.mark.unit
+def test_parse_html_prefers_description_container():
+    html = (
+        "<html><head><script>var x = 1;</script></head><body>"
+        "<nav>Home | Jobs</nav>"
+        "<div class='job-description'>"
+        + "Responsibilities include analysis. "
+        * 20
+        + "</div>"
+        "<footer>Contact</footer></body></html>"
+    )
+
+    text = fetcher._parse_html(html)
+
+    assert text.startswith("Responsibilities include analysis.")
+    assert "Home | Jobs" not in text
+    assert "var x" not in text
+
+
+@pytest.mark.unit
+def test_parse_html_returns_first_long_trusted_container():
+    body = "Main duties and requirements. " * 20
+    html = (
+        "<html><body>"
+        f"<div itemprop='description'>{body}</div>"
+        f"<article>{body * 3}</article>"
+        "</body></html>"
+    )
+
+    assert fetcher._parse_html(html) == body.strip()
+
+
+@pytest.mark.unit
+def test_pdf_candidates_regex_sweep_matches_soup_fallback(monkeypatch):
+    base = GENERIC_URLS["example"]
+    html = (
+        "<ul><li>Vacancy notice <a class='x' href='/docs/VN-1&amp;2.PDF'>"
+        "<span>Vacancy</span> notice</a> (PDF)</li>"
+        "<li><a href=/manual.pdf>Candidate manual</a></li>"
+        '<p>Get it: <a href="/dl?id=3">Download PDF</a></p></ul>'
+    )
+
+    fast = fetcher._extract_pdf_candidates(html, f"{base}/page")
+    monkeypatch.setattr(fetcher, "_scan_anchors", lambda _html: None)
+    slow = fetcher._extract_pdf_candidates(html, f"{base}/page")
+
+    assert fast == slow
+    assert fast[0].url == f"{base}/docs/VN-1&2.PDF"
+    assert fast[0].context == "Vacancy notice Vacancy notice (PDF)"
+
+
+# Pages shaped like the vacancy listings the PDF picker sees in practice.
+_PDF_LINK_PAGES = (
+    "<ul><li>Vacancy notice <a class='x' href='/docs/VN-1&amp;2.PDF'>"
+    "<span>Vacancy</span> notice</a> (PDF)</li>"
+    "<li><a href=/manual.pdf>Candidate manual</a></li>"
+    '<p>Get it: <a href="/dl?id=3">Download PDF</a></p></ul>',
+    "<table><tr><td>Data Analyst (AD 6)</td>"
+    "<td><a href='/files/ref-2024-01.pdf'>Vacancy notice</a></td></tr>"
+    "<tr><td>Privacy notice</td>"
+    "<td><a href='/files/privacy.pdf'>PDF</a></td></tr></table>",
+    "<div class='actions'><p><a href='/job/42/print?format=pdf'>"
+    "Download PDF</a></p><p><a href='/apply'>Apply</a></p></div>",
+    "<p>Please read the <a href='/call/cfe-17.pdf'>call for expressions "
+    "of interest</a> before applying.</p>"
+    "<p><a href='/call/cfe-17.docx'>Word version (PDF also available)</a></p>",
+)
+
+
+def _soup_pdf_candidates(html, page_url):
+    """Anchor candidates as the BeautifulSoup implementation built them."""
+    candidates, seen = [], set()
+    for link in BeautifulSoup(html, "html.parser").find_all("a", href=True):
+        href = link.get("href", "")
+        if not href:
+            continue
+        text = link.get_text(" ", strip=True)
+        lowered = (text + " " + href).lower()
+        if (
+            ".pdf" not in href.lower()
+            and "pdf" not in text.lower()
+            and "download pdf" not in lowered
+        ):
+            continue
+        full = urljoin(page_url, href)
+        if full in seen:
+            continue
+        seen.add(full)
+        context = link.parent.get_text(" ", strip=True) if link.parent else ""
+        candidates.append(fetcher._PdfCandidate(full, text, context[:400]))
+    return candidates
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("html", _PDF_LINK_PAGES)
+def test_pdf_candidate_scores_match_soup_implementation(html):
+    page_url = f"{GENERIC_URLS['example']}/page"
+    title_words = fetcher._norm_words("Data Analyst vacancy notice")
+
+    expected = _soup_pdf_candidates(html, page_url)
+    # Raw-URL candidates from the page source follow the anchor candidates.
+    fast = fetcher._extract_pdf_candidates(html, page_url)[: len(expected)]
+
+    assert fast == expected
+    assert [fetcher._score_pdf_candidate(c, title_words) for c in fast] == [
+        fetcher._score_pdf_candidate(c, title_words) for c in expected
+    ]
+
+
+@pytest.mark.unit
+def test_detect_content_type_remembers_hosts_rejecting_head(monkeypatch):
+    class _Resp:
+        def __init__(self):
+            self.headers = {"Content-Type": "application/pdf"}
+
+        def close(self):
+            pass
+
+    calls = []
+
+    def fake_request(url, method="GET", **kwargs):
+        calls.append(method)
+        if method == "HEAD":
+            err = requests.HTTPError("405 Method Not Allowed")
+            err.response = type("R", (), {"status_code": 405})()
+            raise err
+        return _Resp()
+
+    monkeypatch.setattr(fetcher, "_request", fake_request)
+    monkeypatch.setattr(fetcher, "_NO_HEAD_HOSTS", set())
+    monkeypatch.setattr(fetcher, "_CONTENT_TYPE_CACHE", {})
+    base = GENERIC_URLS["example"]
+
+    assert fetcher.detect_content_type(f"{base}/download?id=1") == "pdf"
+    assert fetcher.detect_content_type(f"{base}/download?id=2") == "pdf"
+    assert fetcher.detect_content_type(f"{base}/download?id=2") == "pdf"
+    assert calls == ["HEAD", "GET", "GET"]
+
+
+@pytest.mark.unit
+def test_detect_content_type_does_not_cache_failures(monkeypatch):
+    calls = []
+
+    def failing_request(url, method="GET", **kwargs):
+        calls.append(method)
+        raise requests.ConnectionError("connection reset")
+
+    monkeypatch.setattr(fetcher, "_request", failing_request)
+    monkeypatch.setattr(fetcher, "_CONTENT_TYPE_CACHE", {})
+    url = f"{GENERIC_URLS['example_job']}/notice"
+
+    assert fetcher.detect_content_type(url) == "html"
+    assert fetcher.detect_content_type(url) == "html"
+    assert calls == ["HEAD", "HEAD"]
+
+
+@pytest.mark.unit
+def test_nextjs_description_prefers_description_leaf(monkeypatch):
+    import json
+
+    monkeypatch.setattr(fetcher, "_host_platforms", lambda host: frozenset({"nextjs"}))
+    body = "Responsibilities &amp; tasks include analysis and reporting. " * 6
+    payload = {
+        "props": {
+            "pageProps": {
+                "nav": {"footer": "Privacy policy and imprint. " * 10},
+                "job": {"title": "Analyst", "jobDescription": f"<p>{body}</p>"},
+                "summary": "Plain summary text without markup. " * 6,
+            }
+        }
+    }
+    html = (
+        '<html><body><script id="__NEXT_DATA__" type="application/json">'
+        f"{json.dumps(payload)}</script></body></html>"
+    )
+
+    text = fetcher._extract_nextjs_description_from_html(
+        f"{GENERIC_URLS['example']}/jobs/1", html
+    )
+
+    assert text.startswith("Responsibilities & tasks include analysis")
+    assert "<p>" not in text
+
+
+@pytest.mark.unit
+def test_legacy_ats_fragments_pick_marker_section():
+    html = (
+        "var d='x!|!!*!<p>How to apply: send your CV.</p>"
+        "!|!!*!<p>Duties and responsibilities</p><p>Analyse data\\: daily.</p>"
+        "!|!12345678!|!trailing';"
+    )
+
+    text = fetcher._extract_legacy_ats_description(html)
+
+    assert text == "Duties and responsibilities\nAnalyse data: daily."
+
+
+@pytest.mark.unit
+def test_select_embedded_pdf_link_probes_only_top_candidates(monkeypatch):
+    candidates = [
+        fetcher._PdfCandidate(f"https://example.org/doc?id={i}", str(100 - i))
+        for i in range(8)
+    ]
+    monkeypatch.setattr(
+        fetcher, "_extract_pdf_candidates", lambda html, url: candidates
+    )
+    monkeypatch.setattr(fetcher, "_score_pdf_candidate", lambda c, words: int(c.text))
+    probed = []
+
+    def fake_detect(url):
+        probed.append(url)
+        return "html"
+
+    monkeypatch.setattr(fetcher, "detect_content_type", fake_detect)
+
+    assert fetcher._select_embedded_pdf_link("", "https://example.org", "T", "X") == ""
+    assert probed == [c.url for c in candidates[: fetcher._PDF_PROBE_LIMIT]]
+
+
+@pytest.mark.unit
+def test_api_v1_downloads_vacancy_list_once_per_tenant(monkeypatch):
+    rows = [
+        {"jobVacancyId": 1, "jobDescription": "<p>First role duties.</p>"},
+        {"jobVacancyId": 2, "purposeforthepost": "<p>Second role purpose.</p>"},
+    ]
+
+    class _Resp:
+        content = fetcher.jsonio.dumps(rows)
+
+        def raise_for_status(self):
+            pass
+
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        return _Resp()
+
+    monkeypatch.setattr(fetcher._session(), "get", fake_get)
+    monkeypatch.setattr(fetcher, "_host_platforms", lambda host: frozenset({"api_v1"}))
+    monkeypatch.setattr(fetcher, "_VACANCY_LIST_CACHE", {})
+    base = GENERIC_URLS["example"]
+
+    first = fetcher._extract_api_based_description_v1(f"{base}/vacancies/1")
+    second = fetcher._extract_api_based_description_v1(f"{base}/vacancies/2")
+
+    assert first == "First role duties."
+    assert second == "Second role purpose."
+    assert calls == [f"{base}/api/CurrentJobVacancies"]
+
+
+@pytest.mark.unit
+def test_detect_content_type_trusts_pdf_suffix_before_query(monkeypatch):
+    def no_request(*args, **kwargs):
+        raise AssertionError("unexpected request")
+
+    monkeypatch.setattr(fetcher, "_request", no_request)
+    base = GENERIC_URLS["example"]
+
+    assert fetcher.detect_content_type(f"{base}/docs/VN-12.PDF?download=1") == "pdf"
+    assert fetcher.detect_content_type(f"{base}/docs/notice.pdf#page=2") == "pdf"
+
+
+@pytest.mark.unit
+def test_detect_content_type_skips_head_for_html_only_hosts(monkeypatch):
+    def no_request(*args, **kwargs):
+        raise AssertionError("unexpected request")
+
+    monkeypatch.setattr(fetcher, "_request", no_request)
+    monkeypatch.setattr(fetcher, "_host_platforms", lambda host: frozenset({"api_v2"}))
+    fetcher._is_html_only_url.cache_clear()
+    base = GENERIC_URLS["example"]
+
+    assert fetcher.detect_content_type(f"{base}/job/123") == "html"
+    fetcher._is_html_only_url.cache_clear()
+
+
+@pytest.mark.unit
+def test_fetcher_sessions_are_per_thread_and_reset_with_base():
+    main = fetcher._session()
+    other = []
+    worker = threading.Thread(target=lambda: other.append(fetcher._session()))
+    worker.start()
+    worker.join()
+    assert other[0] is not main
+
+    scraper_base = sys.modules[fetcher.fetch.__module__]
+    scraper_session = scraper_base._session()
+    main.cookies.set("org", "A")
+    fetcher.reset_sessions()
+
+    fresh = fetcher._session()
+    assert fresh is not main
+    assert not fresh.cookies
+    assert scraper_base._session() is not scraper_session
@@ -0,0 +1,81 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from enrichment import ratelimit
+from enrichment.ratelimit import HostSlots, HostThrottle, TokenBucket
+from tests.test_config import GENERIC_URLS
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    clock = {"now": 100.0}
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(ratelimit.time, "sleep", fake_sleep)
+    return clock, sleeps
+
+
+@pytest.mark.unit
+def test_token_bucket_allows_burst_then_paces(fake_clock):
+    _clock, sleeps = fake_clock
+    bucket = TokenBucket(rate_per_sec=2.0, capacity=3)
+
+    waits = [bucket.acquire_sync() for _ in range(5)]
+
+    assert waits == [0.0, 0.0, 0.0, pytest.approx(0.5), pytest.approx(0.5)]
+    assert len(sleeps) == 2
+
+
+@pytest.mark.unit
+def test_token_bucket_refills_while_idle(fake_clock):
+    clock, sleeps = fake_clock
+    bucket = TokenBucket(rate_per_sec=2.0, capacity=3)
+    for _ in range(3):
+        bucket.acquire_sync()
+
+    clock["now"] += 10.0
+    assert [bucket.acquire_sync() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert sleeps == []
+
+
+@pytest.mark.unit
+def test_host_throttle_paces_same_host_only(fake_clock):
+    _clock, sleeps = fake_clock
+    throttle = HostThrottle(min_interval=1.5, burst=1)
+
+    assert throttle.wait(f"{GENERIC_URLS['example']}/1") == 0
+    assert throttle.wait(f"{GENERIC_URLS['example_job']}/1") == 0
+    assert throttle.wait(f"{GENERIC_URLS['example']}/2") == pytest.approx(1.5)
+    assert sleeps == [pytest.approx(1.5)]
+
+
+@pytest.mark.unit
+def test_host_slots_cap_in_flight_requests_per_host():
+    slots = HostSlots(per_host=2)
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def _request(url):
+        with slots.slot(url):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.01)
+            with lock:
+                active["now"] -= 1
+
+    urls = [f"{GENERIC_URLS['example']}/{i}" for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_request, urls))
+
+    assert active["peak"] == 2
+    assert slots.slot(urls[0]) is slots.slot(urls[1])
+    assert slots.slot(urls[0]) is not slots.slot(GENERIC_URLS["example_job"])
@@ -1,14 +1,35 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from enrichment.detail_cache import DetailCache
+from enrichment.ratelimit import HostSlots, HostThrottle
 from enrichment.runner import (
     PROJECT_ROOT,
     EventLogger,
     RunnerConfig,
     _fetch_one,
+    _load_scraper_module,
+    _map_jobs,
     collect_postings_org_via_runner,
     enrich_org_via_runner,
 )
 from tests.test_config import GENERIC_URLS
 
 
+@pytest.fixture(autouse=True)
+def _isolate_runner_state(monkeypatch, tmp_path):
+    # Keep the listing cache out of ops/runs/output; no pacing or shared cache.
+    monkeypatch.setattr("enrichment.schema.OUTPUT_DIR", tmp_path / "output")
+    monkeypatch.setattr("enrichment.runner._HOST_THROTTLE", HostThrottle(0.0))
+    monkeypatch.setattr("enrichment.runner._HOST_SLOTS", HostSlots())
+    monkeypatch.setattr("enrichment.runner._DETAIL_CACHE", DetailCache())
+
+
 def test_event_logger_writes_ndjson(tmp_path):
     path = tmp_path / "run.ndjson"
     cfg = RunnerConfig(run_id="r1", batch_id="B00", verbose=False, ndjson_path=path)
@@ -20,9 +41,127 @@ def test_event_logger_writes_ndjson(tmp_path):
 
     lines = path.read_text().strip().splitlines()
     assert len(lines) == 1
-    assert '"event": "org_start"' in lines[0]
-    assert '"run_id": "r1"' in lines[0]
-    assert '"batch_id": "B00"' in lines[0]
+    event = json.loads(lines[0])
+    assert event["event"] == "org_start"
+    assert event["run_id"] == "r1"
+    assert event["batch_id"] == "B00"
+
+
+def test_event_logger_emit_many_writes_in_order(tmp_path):
+    path = tmp_path / "run.ndjson"
+    cfg = RunnerConfig(run_id="r1", verbose=False, ndjson_path=path)
+    logger = EventLogger(cfg)
+    try:
+        logger.emit_many(
+            [
+                {"event": "org_done", "org_abbrev": "TESTORG", "job_count": 0},
+                {"event": "org_result", "org_abbrev": "TESTORG", "error": "boom"},
+            ]
+        )
+    finally:
+        logger.close()
+
+    events = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [e["event"] for e in events] == ["org_done", "org_result"]
+    assert all(e["run_id"] == "r1" for e in events)
+    assert events[1]["error"] == "boom"
+
+
+def test_event_logger_buffers_until_close(tmp_path):
+    path = tmp_path / "run.ndjson"
+    cfg = RunnerConfig(
+        run_id="r1",
+        verbose=False,
+        ndjson_path=path,
+        ndjson_flush_seconds=3600.0,
+    )
+    logger = EventLogger(cfg)
+    try:
+        for i in range(3):
+            logger.emit("job_start", job_index=i)
+        assert path.read_text() == ""
+    finally:
+        logger.close()
+
+    lines = path.read_text().strip().splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[2])["job_index"] == 2
+
+
+def test_event_logger_flushes_periodically_without_new_events(tmp_path):
+    path = tmp_path / "run.ndjson"
+    cfg = RunnerConfig(
+        run_id="r1", verbose=False, ndjson_path=path, ndjson_flush_seconds=0.05
+    )
+    logger = EventLogger(cfg)
+    try:
+        logger.emit("job_start", job_index=1)
+        deadline = time.monotonic() + 5.0
+        while not path.read_text() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert json.loads(path.read_text())["job_index"] == 1
+    finally:
+        logger.close()
+
+
+def test_event_logger_close_reraises_writer_error(tmp_path):
+    class _FailingWrites:
+        def __init__(self, fh):
+            self._fh = fh
+
+        def write(self, data):
+            raise OSError("disk full")
+
+        def __getattr__(self, name):
+            return getattr(self._fh, name)
+
+    path = tmp_path / "run.ndjson"
+    logger = EventLogger(RunnerConfig(run_id="r1", verbose=False, ndjson_path=path))
+    logger._fh = _FailingWrites(logger._fh)
+    logger.emit("job_start", job_index=1)
+
+    with pytest.raises(OSError, match="disk full"):
+        logger.close()
+    assert logger._fh is None
+
+
+def test_event_logger_samples_per_job_events(tmp_path):
+    path = tmp_path / "run.ndjson"
+    cfg = RunnerConfig(run_id="r1", verbose=False, ndjson_path=path, sample_rate=3)
+    logger = EventLogger(cfg)
+    try:
+        for i in range(6):
+            logger.emit("job_result", job_index=i)
+        logger.emit("job_error", job_index=6)
+    finally:
+        logger.close()
+
+    events = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [(e["event"], e["job_index"]) for e in events] == [
+        ("job_result", 2),
+        ("job_result", 5),
+        ("job_error", 6),
+    ]
+
+
+def test_event_logger_samples_each_event_type_separately(tmp_path):
+    path = tmp_path / "run.ndjson"
+    cfg = RunnerConfig(run_id="r1", verbose=False, ndjson_path=path, sample_rate=2)
+    logger = EventLogger(cfg)
+    try:
+        for i in range(4):
+            logger.emit("job_start", job_index=i)
+            logger.emit("job_result", job_index=i)
+    finally:
+        logger.close()
+
+    events = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [(e["event"], e["job_index"]) for e in events] == [
+        ("job_start", 1),
+        ("job_result", 1),
+        ("job_start", 3),
+        ("job_result", 3),
+    ]
 
 
 def test_event_logger_live_events_prints_json(tmp_path, capsys):
@@ -157,6 +296,272 @@ def test_collect_postings_stops_org_after_consecutive_429(monkeypatch, tmp_path)
     assert out["jobs"][4]["status_reason"] == "org_rate_limited_skip"
 
 
+def test_collect_postings_job_workers_keep_listing_order(monkeypatch, tmp_path):
+    path = tmp_path / "run.ndjson"
+    cfg = RunnerConfig(run_id="r1", batch_id="B00", verbose=False, ndjson_path=path)
+    logger = EventLogger(cfg)
+
+    jobs = [
+        {"title": f"Role {i}", "url": f"{GENERIC_URLS['example']}/{i}"}
+        for i in range(1, 7)
+    ]
+    monkeypatch.setattr(
+        "enrichment.runner.run_scraper_for_org", lambda *args, **kwargs: jobs
+    )
+
+    def fake_fetch_one(**kwargs):
+        # Later jobs finish first so completion order differs from listing order.
+        time.sleep(0.01 * (kwargs["total"] - kwargs["idx"]))
+        return {
+            "content_type": "html",
+            "description": kwargs["title"],
+            "enrich_status": "ok",
+            "fetch_seconds": 0.0,
+            "error": "",
+        }
+
+    monkeypatch.setattr("enrichment.runner._fetch_one", fake_fetch_one)
+    try:
+        out = collect_postings_org_via_runner(
+            org_abbrev="TESTORG",
+            org_name="Test Organization",
+            scraper_path=PROJECT_ROOT / "scrapers" / "scrape_example.py",
+            is_playwright_scraper=False,
+            logger=logger,
+            job_workers=4,
+        )
+    finally:
+        logger.close()
+
+    assert [j["index"] for j in out["jobs"]] == [1, 2, 3, 4, 5, 6]
+    assert [j["description"] for j in out["jobs"]] == [j["title"] for j in jobs]
+
+
+def test_map_jobs_workers_close_their_own_playwright_browsers(monkeypatch):
+    used: set[int] = set()
+    closed: list[int] = []
+    lock = threading.Lock()
+
+    class _RecordingPool:
+        def close(self):
+            with lock:
+                closed.append(threading.get_ident())
+
+    def _job(i, job):
+        with lock:
+            used.add(threading.get_ident())
+        time.sleep(0.005)
+        return job * 2
+
+    monkeypatch.setattr("enrichment.runner.PLAYWRIGHT_POOL", _RecordingPool())
+
+    assert _map_jobs(_job, list(range(10)), workers=3) == [j * 2 for j in range(10)]
+    assert used <= set(closed)
+
+
+def test_collect_postings_caps_playwright_job_workers(monkeypatch, tmp_path):
+    path = tmp_path / "run.ndjson"
+    cfg = RunnerConfig(run_id="r1", batch_id="B00", verbose=False, ndjson_path=path)
+    logger = EventLogger(cfg)
+
+    jobs = [
+        {"title": f"Role {i}", "url": f"{GENERIC_URLS['example']}/{i}"}
+        for i in range(1, 9)
+    ]
+    monkeypatch.setattr(
+        "enrichment.runner.run_scraper_for_org", lambda *args, **kwargs: jobs
+    )
+    monkeypatch.setattr("enrichment.runner.MAX_PLAYWRIGHT_WORKERS", 2)
+
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fake_fetch_one(**kwargs):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.01)
+        with lock:
+            active["now"] -= 1
+        return {
+            "content_type": "html",
+            "description": kwargs["title"],
+            "enrich_status": "ok",
+            "fetch_seconds": 0.0,
+            "error": "",
+        }
+
+    monkeypatch.setattr("enrichment.runner._fetch_one", fake_fetch_one)
+    try:
+        out = collect_postings_org_via_runner(
+            org_abbrev="TESTORG",
+            org_name="Test Organization",
+            scraper_path=PROJECT_ROOT / "scrapers" / "scrape_example.py",
+            is_playwright_scraper=True,
+            logger=logger,
+            job_workers=8,
+        )
+    finally:
+        logger.close()
+
+    assert len(out["jobs"]) == 8
+    assert active["peak"] == 2
+
+
+def test_collect_postings_paces_fetches_with_host_throttle(monkeypatch, tmp_path):
+    path = tmp_path / "run.ndjson"
+    cfg = RunnerConfig(run_id="r1", batch_id="B00", verbose=False, ndjson_path=path)
+    logger = EventLogger(cfg)
+
+    jobs = [
+        {"title": f"Role {i}", "url": f"{GENERIC_URLS['example']}/{i}"}
+        for i in range(1, 4)
+    ]
+    monkeypatch.setattr(
+        "enrichment.runner.run_scraper_for_org", lambda *args, **kwargs: jobs
+    )
+
+    calls: list[tuple[str, str]] = []
+
+    class _RecordingThrottle:
+        def wait(self, url):
+            calls.append(("wait", url))
+
+    def fake_fetch_one(**kwargs):
+        calls.append(("fetch", kwargs["url"]))
+        return {
+            "content_type": "html",
+            "description": kwargs["title"],
+            "enrich_status": "ok",
+            "fetch_seconds": 0.0,
+            "error": "",
+        }
+
+    monkeypatch.setattr("enrichment.runner._HOST_THROTTLE", _RecordingThrottle())
+    monkeypatch.setattr("enrichment.runner._fetch_one", fake_fetch_one)
+    try:
+        collect_postings_org_via_runner(
+            org_abbrev="TESTORG",
+            org_name="Test Organization",
+            scraper_path=PROJECT_ROOT / "scrapers" / "scrape_example.py",
+            is_playwright_scraper=False,
+            logger=logger,
+        )
+    finally:
+        logger.close()
+
+    expected = []
+    for job in jobs:
+        expected += [("wait", job["url"]), ("fetch", job["url"])]
+    assert calls == expected
+
+
+def test_collect_postings_reuses_cached_detail(monkeypatch, tmp_path):
+    path = tmp_path / "run.ndjson"
+    cfg = RunnerConfig(run_id="r1", batch_id="B00", verbose=False, ndjson_path=path)
+    logger = EventLogger(cfg)
+
+    jobs = [
+        {"title": f"Role {i}", "url": f"{GENERIC_URLS['example']}/{i}"}
+        for i in range(1, 3)
+    ]
+    monkeypatch.setattr(
+        "enrichment.runner.run_scraper_for_org", lambda *args, **kwargs: jobs
+    )
+    cache = DetailCache()
+    cache.put(
+        jobs[0]["url"],
+        {"enrich_status": "ok", "content_type": "html", "description": "cached"},
+    )
+    monkeypatch.setattr("enrichment.runner._DETAIL_CACHE", cache)
+
+    fetched: list[str] = []
+
+    def fake_fetch_one(**kwargs):
+        fetched.append(kwargs["url"])
+        return {
+            "content_type": "html",
+            "description": "fetched",
+            "enrich_status": "ok",
+            "fetch_seconds": 0.2,
+            "error": "",
+        }
+
+    monkeypatch.setattr("enrichment.runner._fetch_one", fake_fetch_one)
+    try:
+        out = collect_postings_org_via_runner(
+            org_abbrev="TESTORG",
+            org_name="Test Organization",
+            scraper_path=PROJECT_ROOT / "scrapers" / "scrape_example.py",
+            is_playwright_scraper=False,
+            logger=logger,
+        )
+    finally:
+        logger.close()
+
+    assert fetched == [jobs[1]["url"]]
+    assert [j["description"] for j in out["jobs"]] == ["cached", "fetched"]
+    assert out["jobs"][0]["fetch_seconds"] == 0.0
+    assert cache.get(jobs[1]["url"])["description"] == "fetched"
+
+
+def test_parallel_orgs_share_host_throttle(monkeypatch, tmp_path):
+    jobs_by_org = {
+        org: [
+            {"title": f"{org} {i}", "url": f"{GENERIC_URLS['example']}/{org}/{i}"}
+            for i in range(1, 4)
+        ]
+        for org in ("ORGA", "ORGB")
+    }
+    monkeypatch.setattr(
+        "enrichment.runner.run_scraper_for_org",
+        lambda scraper_path, org_abbrev, *args, **kwargs: jobs_by_org[org_abbrev],
+    )
+
+    waited: list[str] = []
+    lock = threading.Lock()
+
+    class _RecordingThrottle:
+        def wait(self, url):
+            with lock:
+                waited.append(url)
+
+    def fake_fetch_one(**kwargs):
+        return {
+            "content_type": "html",
+            "description": kwargs["title"],
+            "enrich_status": "ok",
+            "fetch_seconds": 0.0,
+            "error": "",
+        }
+
+    monkeypatch.setattr("enrichment.runner._HOST_THROTTLE", _RecordingThrottle())
+    monkeypatch.setattr("enrichment.runner._fetch_one", fake_fetch_one)
+    cfg = RunnerConfig(
+        run_id="r1", batch_id="B00", verbose=False, ndjson_path=tmp_path / "run.ndjson"
+    )
+    logger = EventLogger(cfg)
+
+    def _run(org):
+        return collect_postings_org_via_runner(
+            org_abbrev=org,
+            org_name=org,
+            scraper_path=PROJECT_ROOT / "scrapers" / "scrape_example.py",
+            is_playwright_scraper=False,
+            logger=logger,
+            job_workers=2,
+        )
+
+    try:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(_run, jobs_by_org))
+    finally:
+        logger.close()
+
+    expected = [job["url"] for jobs in jobs_by_org.values() for job in jobs]
+    assert sorted(waited) == sorted(expected)
+
+
 def test_collect_postings_uses_eib_scraper_detail_without_fetch(monkeypatch, tmp_path):
     path = tmp_path / "run.ndjson"
     cfg = RunnerConfig(run_id="r1", batch_id="B00", verbose=False, ndjson_path=path)
@@ -269,7 +674,9 @@ def test_enrich_org_non_eib_does_not_use_scraper_detail(monkeypatch, tmp_path):
     monkeypatch.setattr(
         "enrichment.runner.run_scraper_for_org", lambda *args, **kwargs: jobs
     )
-    monkeypatch.setattr("enrichment.runner.load_output", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        "enrichment.runner.load_enriched_by_url", lambda *args, **kwargs: {}
+    )
     monkeypatch.setattr(
         "enrichment.runner.save_output",
         lambda *args, **kwargs: tmp_path / "TESTORG.json",
@@ -306,3 +713,78 @@ def test_enrich_org_non_eib_does_not_use_scraper_detail(monkeypatch, tmp_path):
 
     assert calls["n"] == 1
     assert out["job_count"] == 1
+
+
+def test_enrich_org_reuses_cached_listing_unless_forced(monkeypatch, tmp_path):
+    path = tmp_path / "run.ndjson"
+    cfg = RunnerConfig(run_id="r1", batch_id="B00", verbose=False, ndjson_path=path)
+    logger = EventLogger(cfg)
+
+    scrapes = {"n": 0}
+
+    def fake_scraper(*args, **kwargs):
+        scrapes["n"] += 1
+        return [{"title": "Role A", "url": f"{GENERIC_URLS['example']}/job/1"}]
+
+    monkeypatch.setattr("enrichment.runner.run_scraper_for_org", fake_scraper)
+    monkeypatch.setattr(
+        "enrichment.runner.load_enriched_by_url", lambda *args, **kwargs: {}
+    )
+    monkeypatch.setattr(
+        "enrichment.runner.save_output",
+        lambda *args, **kwargs: tmp_path / "TESTORG.json",
+    )
+    monkeypatch.setattr(
+        "enrichment.runner._fetch_one",
+        lambda **kwargs: {
+            "content_type": "html",
+            "description": "fetched description",
+            "enrich_status": "ok",
+            "fetch_seconds": 0.0,
+            "error": "",
+        },
+    )
+    kwargs = {
+        "org_abbrev": "TESTORG",
+        "org_name": "Test Organization",
+        "scraper_file": "scrape_example.py",
+        "is_playwright_scraper": False,
+        "use_playwright_detail": False,
+        "logger": logger,
+    }
+    try:
+        first = enrich_org_via_runner(force=False, **kwargs)
+        second = enrich_org_via_runner(force=False, **kwargs)
+        enrich_org_via_runner(force=True, **kwargs)
+    finally:
+        logger.close()
+
+    assert scrapes["n"] == 2
+    assert first["job_count"] == second["job_count"] == 1
+    events = [json.loads(line) for line in path.read_text().splitlines()]
+    cached = [e for e in events if e["event"] == "scraper_done" and e.get("cached")]
+    assert len(cached) == 1
+
+
+def test_load_scraper_module_executes_once(tmp_path):
+    scraper = tmp_path / "scrape_counted.py"
+    scraper.write_text("LOADS = []\nLOADS.append(1)\n\ndef scrape():\n    return []\n")
+
+    first = _load_scraper_module(scraper)
+    second = _load_scraper_module(scraper)
+
+    assert first is second
+    assert first.LOADS == [1]
+
+
+def test_load_scraper_module_reloads_edited_file(tmp_path):
+    scraper = tmp_path / "scrape_edited.py"
+    scraper.write_text("VERSION = 1\n")
+    first = _load_scraper_module(scraper)
+
+    scraper.write_text("VERSION = 2\n")
+    stat = scraper.stat()
+    os.utime(scraper, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert first.VERSION == 1
+    assert _load_scraper_module(scraper).VERSION == 2
@@ -0,0 +1,21 @@
+import pytest
+
+from enrichment import schema
+from tests.test_config import GENERIC_URLS
+
+
+@pytest.mark.unit
+def test_save_listing_cache_prunes_older_listings(monkeypatch, tmp_path):
+    monkeypatch.setattr(schema, "OUTPUT_DIR", tmp_path)
+    jobs = [{"title": "Role", "url": f"{GENERIC_URLS['example']}/1"}]
+
+    old = schema.save_listing_cache("TESTORG", "scrape_old.py", jobs)
+    other_org = schema.save_listing_cache("TESTORG2", "scrape_old.py", jobs)
+    new = schema.save_listing_cache("TESTORG", "scrape_new.py", jobs)
+
+    assert not old.exists()
+    assert other_org.exists()
+    assert schema.load_listing_cache("TESTORG", "scrape_new.py") == jobs
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        [new.name, other_org.name]
+    )